@@ -8,20 +8,30 @@ import asyncio
 import logging
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 import json
+import orjson
 import traceback
 
 # Core libraries
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as pads
+import pyarrow.fs as pafs
 import boto3
+from botocore.config import Config
+from boto3.s3.transfer import TransferConfig
 from anthropic import Anthropic
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import seaborn as sns
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter, A4
@@ -42,15 +52,137 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # AWS clients
-s3_client = boto3.client('s3')
+# One warm, pooled S3 client for the whole process: a large connection pool
+# so concurrent transfers don't serialize on sockets, TCP keep-alive so the
+# TLS sessions survive between calls, and adaptive client-side throttling
+_S3_CONFIG = Config(
+    max_pool_connections=64,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=30
+)
+s3_client = boto3.client('s3', config=_S3_CONFIG)
 dynamodb = boto3.resource('dynamodb')
 ssm_client = boto3.client('ssm')
 
+# Claude API key cached across analyzer constructions within a process
+_API_KEY_CACHE = {'value': None, 'expires': 0.0}
+API_KEY_CACHE_TTL_SECONDS = 3600
+
+# Streaming multipart uploads: parts are bounded at 8 MB so report/viz
+# files never sit fully in memory
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True
+)
+
 # Environment variables
 ENVIRONMENT = os.environ.get('ENVIRONMENT', 'prod')
 S3_BUCKET = os.environ.get('S3_BUCKET', '')
 DYNAMODB_TABLE = os.environ.get('DYNAMODB_TABLE', '')
 
+# Columns each analysis actually consumes, keyed by data source. Used for
+# column projection so unused Parquet columns never leave S3.
+REQUIRED_COLUMNS_BY_SOURCE = {
+    'lseg': ['timestamp', 'region', 'data_type', 'price', 'demand', 'supply',
+             'source', 'capacity', 'generation'],
+    'weather': ['timestamp', 'region', 'temperature', 'humidity',
+                'wind_speed', 'cloud_cover'],
+    'economic': ['timestamp', 'indicator', 'value'],
+}
+
+# Prompt template built once at import time - only the data summary varies
+CLAUDE_PROMPT_TEMPLATE = """
+As an expert energy market analyst, please analyze the following weekly energy market data and provide strategic insights:
+
+Data Summary:
+{data_summary}
+
+Please provide a comprehensive analysis covering:
+
+1. **Market Overview**: Key trends and patterns in power markets
+2. **Regional Analysis**: Regional price variations and supply-demand dynamics
+3. **Weather Impact**: How weather conditions affected energy demand and pricing
+4. **Economic Factors**: Impact of commodity prices and economic indicators
+5. **Risk Assessment**: Potential market risks and volatility factors
+6. **Strategic Recommendations**: Actionable insights for energy market participants
+7. **Outlook**: Short-term forecast and key factors to monitor
+
+Please structure your response in clear sections with specific data points and actionable recommendations.
+Focus on practical insights that would be valuable for energy market participants.
+"""
+
+def _to_serializable(obj: Any) -> Any:
+    """Convert DataFrames/Series nested in analysis results to plain types
+
+    The analyses keep their aggregates as pandas objects so the hot path
+    never boxes cells into Python scalars; this walk happens once at the
+    serialization boundary.
+    """
+    if isinstance(obj, pd.DataFrame):
+        frame = obj
+        if isinstance(frame.columns, pd.MultiIndex):
+            frame = frame.copy()
+            frame.columns = ['_'.join(str(level) for level in col if level != '')
+                             for col in frame.columns]
+        return frame.reset_index().to_dict(orient='records')
+    if isinstance(obj, pd.Series):
+        return {str(key): value for key, value in obj.items()}
+    if isinstance(obj, dict):
+        return {key: _to_serializable(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_to_serializable(value) for value in obj]
+    return obj
+
+
+def _pairwise_corr(matrix: np.ndarray, min_periods: int = 1) -> np.ndarray:
+    """NaN-aware pairwise correlation over a dense (T, K) value matrix
+
+    Uses matrix products over the presence mask so all pairwise counts,
+    sums and cross-products come out of a handful of BLAS calls instead
+    of pandas' per-pair Python loop. Pairs with fewer than min_periods
+    joint observations come back as NaN.
+    """
+    mask = ~np.isnan(matrix)
+    present = mask.astype(np.float64)
+    filled = np.where(mask, matrix, 0.0)
+
+    n = present.T @ present            # pairwise observation counts
+    s = filled.T @ present             # s[i, j] = sum of x_i where x_j present
+    q = (filled * filled).T @ present  # q[i, j] = sum of x_i^2 where x_j present
+    p = filled.T @ filled              # p[i, j] = sum of x_i * x_j
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = p - s * s.T / n
+        var_i = q - s * s / n
+        var_j = q.T - s.T * s.T / n
+        corr = cov / np.sqrt(var_i * var_j)
+
+    corr[n < min_periods] = np.nan
+    return corr
+
+
+def _correlation_from_long(codes: np.ndarray, buckets: np.ndarray,
+                           values: np.ndarray, n_indicators: int,
+                           n_buckets: int, min_periods: int = 1) -> np.ndarray:
+    """Compute a K x K correlation matrix straight from long-form data
+
+    Duplicate (bucket, indicator) observations are averaged rather than
+    overwriting each other, mirroring pivot_table(aggfunc='mean').
+    """
+    flat = buckets.astype(np.int64) * n_indicators + codes
+    size = n_buckets * n_indicators
+    sums = np.bincount(flat, weights=values, minlength=size)
+    counts = np.bincount(flat, minlength=size)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        matrix = (sums / counts).reshape(n_buckets, n_indicators)
+
+    return _pairwise_corr(matrix, min_periods=min_periods)
+
+
 class EnergyMarketAnalyzer:
     """Main analysis engine for energy market data"""
     
@@ -64,80 +196,176 @@ class EnergyMarketAnalyzer:
         # Create output directories
         self.output_dir = Path('/tmp/analysis')
         self.output_dir.mkdir(exist_ok=True)
+
+        # Arrow-native S3 filesystem for Parquet dataset reads
+        self._s3fs = pafs.S3FileSystem(region=os.environ.get('AWS_REGION', 'us-east-1'))
+
+        # Executor for running the independent analyses side by side
+        self._analysis_pool = ThreadPoolExecutor(max_workers=3)
         
         # Configure visualization style
         plt.style.use('seaborn-v0_8')
         sns.set_palette("husl")
+
+        # One Figure reused for every chart - bypasses pyplot's per-figure
+        # state machinery and repeated axes initialization
+        self._fig = Figure(figsize=(12, 8))
+        self._canvas = FigureCanvasAgg(self._fig)
     
     def setup_claude_client(self):
         """Initialize Claude AI client"""
         try:
-            # Get Claude API key from Parameter Store
-            response = ssm_client.get_parameter(
-                Name='/nexus-ena/claude-api-key',
-                WithDecryption=True
-            )
-            api_key = response['Parameter']['Value']
+            # Get Claude API key from Parameter Store, keeping it cached at
+            # module level so re-constructions in a warm process skip the
+            # SSM round-trip
+            if _API_KEY_CACHE['value'] and time.time() < _API_KEY_CACHE['expires']:
+                api_key = _API_KEY_CACHE['value']
+            else:
+                response = ssm_client.get_parameter(
+                    Name='/nexus-ena/claude-api-key',
+                    WithDecryption=True
+                )
+                api_key = response['Parameter']['Value']
+                _API_KEY_CACHE['value'] = api_key
+                _API_KEY_CACHE['expires'] = time.time() + API_KEY_CACHE_TTL_SECONDS
+
             self.claude_client = Anthropic(api_key=api_key)
             logger.info("Claude AI client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Claude client: {str(e)}")
             raise
     
+    def _read_source_dataset(self, data_source: str, keys: List[str],
+                             cutoff_date: datetime) -> pd.DataFrame:
+        """Read one source's Parquet objects through the Arrow dataset API
+
+        The native C++ reader prefetches byte ranges, prunes columns and
+        skips row groups outside the analysis window, so only the needed
+        bytes cross the wire.
+        """
+        # pre_buffer coalesces column-chunk range requests per file so the
+        # reader issues a few large GETs instead of many small ones
+        parquet_format = pads.ParquetFileFormat(
+            default_fragment_scan_options=pads.ParquetFragmentScanOptions(pre_buffer=True)
+        )
+        paths = [f"{self.s3_bucket}/{key}" for key in keys]
+        dataset = pads.dataset(paths, filesystem=self._s3fs, format=parquet_format)
+
+        # Without an explicit schema the dataset adopts the first fragment's
+        # and silently drops columns the others carry - the lseg group mixes
+        # SFTP-collector and Lambda-collector layouts, so unify across every
+        # fragment and let the scan null-fill the gaps
+        unified = pa.unify_schemas(
+            [fragment.physical_schema for fragment in dataset.get_fragments()]
+        )
+        if unified != dataset.schema:
+            dataset = pads.dataset(paths, filesystem=self._s3fs,
+                                   format=parquet_format, schema=unified)
+
+        wanted = REQUIRED_COLUMNS_BY_SOURCE.get(data_source)
+        columns = None
+        if wanted:
+            columns = [c for c in wanted if c in dataset.schema.names] or None
+
+        # Predicate pushdown on timestamp; the collectors store ISO-8601
+        # strings, which order lexicographically, so compare in kind
+        filter_expr = None
+        ts_field = dataset.schema.field('timestamp') if 'timestamp' in dataset.schema.names else None
+        if ts_field is not None:
+            if pa.types.is_timestamp(ts_field.type):
+                filter_expr = pads.field('timestamp') >= pa.scalar(cutoff_date)
+            elif pa.types.is_string(ts_field.type) or pa.types.is_large_string(ts_field.type):
+                filter_expr = pads.field('timestamp') >= cutoff_date.isoformat()
+
+        table = dataset.to_table(columns=columns, filter=filter_expr, use_threads=True)
+        # Fragments are concatenated zero-copy as chunked arrays; convert to
+        # pandas once, releasing the Arrow buffers as blocks are built
+        return table.to_pandas(self_destruct=True, split_blocks=True)
+
+    def _list_prefix(self, prefix: str) -> List[str]:
+        """List all object keys under a single S3 prefix"""
+        keys = []
+        paginator = s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.s3_bucket, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                keys.append(obj['Key'])
+        return keys
+
+    def _recent_data_prefixes(self, days_back: int) -> List[str]:
+        """Build the date-partitioned prefixes covering the analysis window
+
+        Both collector layouts are covered: the SFTP collector writes
+        raw-data/YYYY/MM/DD/ and the Lambda collector writes
+        raw-data/year=YYYY/month=MM/day=DD/.
+        """
+        prefixes = []
+        today = datetime.utcnow()
+        for offset in range(days_back + 1):
+            day = today - timedelta(days=offset)
+            prefixes.append(f"raw-data/{day.strftime('%Y/%m/%d')}/")
+            prefixes.append(
+                f"raw-data/year={day.strftime('%Y')}/month={day.strftime('%m')}/day={day.strftime('%d')}/"
+            )
+        return prefixes
+
     async def load_recent_data(self, days_back: int = 7) -> Dict[str, pd.DataFrame]:
         """Load recent data from S3 for analysis"""
         logger.info(f"Loading data from the last {days_back} days")
-        
-        datasets = {}
+
         cutoff_date = datetime.utcnow() - timedelta(days=days_back)
-        
+
         try:
-            # List objects in the raw-data folder
-            paginator = s3_client.get_paginator('list_objects_v2')
-            pages = paginator.paginate(Bucket=self.s3_bucket, Prefix='raw-data/')
-            
-            for page in pages:
-                if 'Contents' not in page:
-                    continue
-                    
-                for obj in page['Contents']:
-                    key = obj['Key']
-                    last_modified = obj['LastModified'].replace(tzinfo=None)
-                    
-                    # Only load recent data
-                    if last_modified < cutoff_date:
-                        continue
-                    
-                    # Extract data source from filename
-                    filename = key.split('/')[-1]
-                    data_source = filename.split('_')[0]
-                    
-                    try:
-                        # Download and read Parquet file
-                        response = s3_client.get_object(Bucket=self.s3_bucket, Key=key)
-                        df = pd.read_parquet(BytesIO(response['Body'].read()))
-                        
-                        if data_source not in datasets:
-                            datasets[data_source] = []
-                        datasets[data_source].append(df)
-                        
-                        logger.info(f"Loaded {len(df)} records from {key}")
-                        
-                    except Exception as e:
-                        logger.warning(f"Failed to load {key}: {str(e)}")
-                        continue
-            
-            # Combine datasets by source
+            # List only the date partitions inside the analysis window instead
+            # of scanning the whole raw-data/ history and filtering client-side
+            keys = []
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                for prefix_keys in pool.map(self._list_prefix, self._recent_data_prefixes(days_back)):
+                    keys.extend(prefix_keys)
+
+            # Group keys by data source, then let the Arrow dataset reader
+            # fetch each group - scans run in Arrow's own thread pool. The
+            # Lambda collector writes data_source=<name>/ partitions; older
+            # objects carry the source as the filename prefix.
+            keys_by_source = {}
+            for key in keys:
+                data_source = next(
+                    (part.split('=', 1)[1] for part in key.split('/')
+                     if part.startswith('data_source=')),
+                    None
+                ) or key.split('/')[-1].split('_')[0]
+                keys_by_source.setdefault(data_source, []).append(key)
+
             combined_datasets = {}
-            for source, dfs in datasets.items():
-                if dfs:
-                    combined_df = pd.concat(dfs, ignore_index=True)
-                    combined_df['timestamp'] = pd.to_datetime(combined_df['timestamp'])
+            for source, source_keys in keys_by_source.items():
+                try:
+                    combined_df = self._read_source_dataset(source, source_keys, cutoff_date)
+                except Exception as e:
+                    logger.warning(f"Failed to load {source} dataset: {str(e)}")
+                    continue
+
+                if not combined_df.empty:
+                    # Parquet timestamp columns arrive already typed; only
+                    # ISO-string columns still need parsing
+                    if not pd.api.types.is_datetime64_any_dtype(combined_df['timestamp']):
+                        combined_df['timestamp'] = pd.to_datetime(combined_df['timestamp'])
+
+                    # Low-cardinality key columns become categoricals so the
+                    # downstream groupbys and filters work on integer codes
+                    for col in ('region', 'data_type', 'source', 'indicator'):
+                        if col in combined_df.columns:
+                            combined_df[col] = combined_df[col].astype('category')
+
+                    # Reported precision is 2-3 decimals, so float32 is ample;
+                    # halving element size halves the analysis working set
+                    float_cols = combined_df.select_dtypes(include=['float64']).columns
+                    if len(float_cols):
+                        combined_df[float_cols] = combined_df[float_cols].astype('float32')
+
                     combined_datasets[source] = combined_df
                     logger.info(f"Combined {source}: {len(combined_df)} total records")
-            
+
             return combined_datasets
-            
+
         except Exception as e:
             logger.error(f"Failed to load recent data: {str(e)}")
             return {}
@@ -155,9 +383,9 @@ class EnergyMarketAnalyzer:
             if power_data.empty:
                 return analysis
             
-            # Filter power price data
-            power_prices = power_data[power_data['data_type'] == 'power_prices'].copy()
-            renewable_gen = power_data[power_data['data_type'] == 'renewable_generation'].copy()
+            # Filter power price data - masks only, no subframe copies
+            power_prices = power_data[power_data['data_type'] == 'power_prices']
+            renewable_gen = power_data[power_data['data_type'] == 'renewable_generation']
             
             if not power_prices.empty:
                 # Overall market summary
@@ -170,40 +398,48 @@ class EnergyMarketAnalyzer:
                     'total_supply': float(power_prices['supply'].sum())
                 }
                 
-                # Regional analysis
-                regional_stats = power_prices.groupby('region').agg({
+                # Regional analysis - build the groupby once and reuse it for
+                # every regional statistic instead of re-hashing the keys
+                regional_gb = power_prices.groupby('region', sort=False, observed=True)
+                regional_stats = regional_gb.agg({
                     'price': ['mean', 'std', 'min', 'max'],
                     'demand': 'mean',
                     'supply': 'mean'
                 }).round(2)
-                
-                analysis['regional_analysis'] = regional_stats.to_dict()
-                
-                # Price volatility analysis
-                power_prices['price_change'] = power_prices.groupby('region')['price'].pct_change()
-                volatility_by_region = power_prices.groupby('region')['price_change'].std()
-                analysis['price_volatility'] = volatility_by_region.to_dict()
-                
+
+                analysis['regional_analysis'] = regional_stats
+
+                # Price volatility analysis - derived series stay standalone
+                # instead of being written back into a copied frame
+                price_change = regional_gb['price'].pct_change()
+                volatility_by_region = price_change.groupby(
+                    power_prices['region'], sort=False, observed=True
+                ).std()
+                analysis['price_volatility'] = volatility_by_region
+
                 # Supply-demand balance
-                power_prices['supply_demand_ratio'] = power_prices['supply'] / power_prices['demand']
+                supply_demand_ratio = power_prices['supply'] / power_prices['demand']
                 analysis['supply_demand'] = {
-                    'avg_ratio': float(power_prices['supply_demand_ratio'].mean()),
-                    'tight_markets': power_prices[power_prices['supply_demand_ratio'] < 1.1]['region'].tolist()
+                    'avg_ratio': float(supply_demand_ratio.mean()),
+                    'tight_markets': power_prices.loc[supply_demand_ratio < 1.1, 'region'].tolist()
                 }
             
             if not renewable_gen.empty:
                 # Renewable generation analysis
-                renewable_stats = renewable_gen.groupby('source').agg({
+                source_gb = renewable_gen.groupby('source', sort=False, observed=True)
+                renewable_stats = source_gb.agg({
                     'capacity': 'mean',
                     'generation': 'mean'
                 }).round(2)
-                
-                renewable_gen['capacity_factor'] = renewable_gen['generation'] / renewable_gen['capacity']
-                capacity_factors = renewable_gen.groupby('source')['capacity_factor'].mean()
+
+                capacity_factor = renewable_gen['generation'] / renewable_gen['capacity']
+                capacity_factors = capacity_factor.groupby(
+                    renewable_gen['source'], sort=False, observed=True
+                ).mean()
                 
                 analysis['renewable_analysis'] = {
-                    'generation_stats': renewable_stats.to_dict(),
-                    'capacity_factors': capacity_factors.to_dict()
+                    'generation_stats': renewable_stats,
+                    'capacity_factors': capacity_factors
                 }
             
             logger.info("Power market analysis completed")
@@ -225,44 +461,61 @@ class EnergyMarketAnalyzer:
             if weather_data.empty or power_data.empty:
                 return analysis
             
-            # Merge weather and power data by region/timestamp
-            weather_data['region_mapped'] = weather_data['region'].map({
+            # Merge weather and power data by region/timestamp - rename the
+            # handful of categories instead of mapping every row
+            region_mapping = {
                 'New York': 'NYISO',
-                'California': 'CAISO', 
+                'California': 'CAISO',
                 'Texas': 'ERCOT',
                 'Pennsylvania': 'PJM'
-            })
-            
-            power_prices = power_data[power_data['data_type'] == 'power_prices'].copy()
+            }
+            region_cat = weather_data['region']
+            if not isinstance(region_cat.dtype, pd.CategoricalDtype):
+                region_cat = region_cat.astype('category')
+            weather_data['region_mapped'] = region_cat.cat.rename_categories(
+                {cat: region_mapping.get(cat, cat) for cat in region_cat.cat.categories}
+            )
             
-            # Calculate temperature impact on prices
+            power_prices = power_data[power_data['data_type'] == 'power_prices']
+
+            # Calculate temperature impact on prices - join on region/timestamp
+            # and correlate per region in a single vectorized pass
+            merged = weather_data.merge(
+                power_prices[['region', 'timestamp', 'price']],
+                left_on=['region_mapped', 'timestamp'],
+                right_on=['region', 'timestamp'],
+                suffixes=('', '_power')
+            )
+
             temp_price_corr = {}
-            for region in weather_data['region_mapped'].unique():
-                if pd.isna(region):
-                    continue
-                    
-                region_weather = weather_data[weather_data['region_mapped'] == region]
-                region_power = power_prices[power_prices['region'] == region]
-                
-                if len(region_weather) > 0 and len(region_power) > 0:
-                    # Simple correlation analysis
-                    if len(region_weather) == len(region_power):
-                        correlation = np.corrcoef(region_weather['temperature'], region_power['price'])[0, 1]
-                        temp_price_corr[region] = float(correlation) if not np.isnan(correlation) else 0.0
-            
+            if not merged.empty:
+                # observed=True keeps the groupby on the joined regions only;
+                # regions with no matching power rows are dropped, not
+                # reported as a fabricated 0.0 correlation
+                corrs = merged.groupby('region_mapped', observed=True)[['temperature', 'price']].corr()
+                temp_price_corr = (
+                    corrs.xs('temperature', level=1)['price']
+                    .dropna()
+                    .astype(float)
+                    .to_dict()
+                )
+
             analysis['temperature_impact'] = temp_price_corr
             
-            # Identify extreme weather events
+            # Identify extreme weather events - cast columns vectorized and
+            # emit records in one shot instead of iterating rows in Python
             temp_threshold = weather_data['temperature'].quantile(0.95)
-            extreme_temp_events = weather_data[weather_data['temperature'] > temp_threshold]
-            
-            for _, event in extreme_temp_events.iterrows():
-                analysis['extreme_weather_events'].append({
-                    'region': event['region'],
-                    'temperature': float(event['temperature']),
-                    'wind_speed': float(event['wind_speed']),
-                    'timestamp': event['timestamp'].isoformat() if pd.notnull(event['timestamp']) else None
-                })
+            extreme = weather_data.loc[
+                weather_data['temperature'] > temp_threshold,
+                ['region', 'temperature', 'wind_speed', 'timestamp']
+            ].copy()
+
+            extreme['temperature'] = extreme['temperature'].astype(float)
+            extreme['wind_speed'] = extreme['wind_speed'].astype(float)
+            timestamps = extreme['timestamp'].dt.strftime('%Y-%m-%dT%H:%M:%S')
+            extreme['timestamp'] = timestamps.where(timestamps.notna(), None)
+
+            analysis['extreme_weather_events'] = extreme.to_dict(orient='records')
             
             logger.info("Weather impact analysis completed")
             return analysis
@@ -284,22 +537,44 @@ class EnergyMarketAnalyzer:
                 return analysis
             
             # Group by indicator type
-            indicators = economic_data.groupby('indicator')['value'].agg(['mean', 'std', 'min', 'max']).round(2)
-            analysis['market_indicators'] = indicators.to_dict()
+            indicators = economic_data.groupby('indicator', sort=False, observed=True)['value'].agg(
+                ['mean', 'std', 'min', 'max']
+            ).round(2)
+            analysis['market_indicators'] = indicators
             
             # Focus on energy-related commodities
             energy_commodities = ['crude_oil_wti', 'natural_gas_henry_hub', 'coal_price']
             energy_data = economic_data[economic_data['indicator'].isin(energy_commodities)]
             
             if not energy_data.empty:
-                commodity_stats = energy_data.groupby('indicator')['value'].agg(['mean', 'std']).round(2)
-                analysis['commodity_trends'] = commodity_stats.to_dict()
-            
-            # Calculate correlations between key indicators
-            pivot_data = economic_data.pivot(columns='indicator', values='value')
-            if len(pivot_data.columns) > 1:
-                correlations = pivot_data.corr().round(3)
-                analysis['correlations'] = correlations.to_dict()
+                commodity_stats = energy_data.groupby('indicator', sort=False, observed=True)['value'].agg(
+                    ['mean', 'std']
+                ).round(2)
+                analysis['commodity_trends'] = commodity_stats
+            
+            # Calculate correlations between key indicators directly from the
+            # long form - no dense pivot, one vectorized kernel pass
+            indicator_cat = economic_data['indicator']
+            if not isinstance(indicator_cat.dtype, pd.CategoricalDtype):
+                indicator_cat = indicator_cat.astype('category')
+
+            indicator_names = list(indicator_cat.cat.categories)
+            if len(indicator_names) > 1:
+                buckets, unique_ts = pd.factorize(economic_data['timestamp'], sort=True)
+                corr_matrix = _correlation_from_long(
+                    indicator_cat.cat.codes.to_numpy(),
+                    buckets,
+                    economic_data['value'].to_numpy(dtype=np.float64),
+                    len(indicator_names),
+                    len(unique_ts),
+                    min_periods=max(3, len(unique_ts) // 10)
+                )
+                correlations = pd.DataFrame(
+                    np.round(corr_matrix, 3),
+                    index=indicator_names,
+                    columns=indicator_names
+                )
+                analysis['correlations'] = correlations
             
             logger.info("Economic indicators analysis completed")
             return analysis
@@ -308,47 +583,62 @@ class EnergyMarketAnalyzer:
             logger.error(f"Economic indicators analysis failed: {str(e)}")
             return analysis
     
+    def _compact_summary(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce the analysis payload to the headline aggregates for the prompt
+
+        Claude only needs the top-level means/stds to reason about the week -
+        the full nested regional/correlation detail stays in the S3 JSON.
+        """
+        power = analysis_data.get('power_markets', {})
+        weather = analysis_data.get('weather_impact', {})
+        economic = analysis_data.get('economic_indicators', {})
+
+        return _to_serializable({
+            'power_markets': {
+                'summary': power.get('summary', {}),
+                'price_volatility': power.get('price_volatility', {}),
+                'supply_demand': power.get('supply_demand', {})
+            },
+            'weather_impact': {
+                'temperature_impact': weather.get('temperature_impact', {}),
+                'extreme_weather_event_count': len(weather.get('extreme_weather_events', []))
+            },
+            'economic_indicators': {
+                'commodity_trends': economic.get('commodity_trends', {})
+            }
+        })
+
     async def generate_claude_insights(self, analysis_data: Dict[str, Any]) -> str:
         """Generate AI-powered insights using Claude"""
         try:
-            # Prepare data summary for Claude
-            data_summary = {
-                'power_markets': analysis_data.get('power_markets', {}),
-                'weather_impact': analysis_data.get('weather_impact', {}),
-                'economic_indicators': analysis_data.get('economic_indicators', {}),
-                'analysis_timestamp': datetime.utcnow().isoformat()
-            }
-            
-            prompt = f"""
-            As an expert energy market analyst, please analyze the following weekly energy market data and provide strategic insights:
-
-            Data Summary:
-            {json.dumps(data_summary, indent=2, default=str)}
-
-            Please provide a comprehensive analysis covering:
-
-            1. **Market Overview**: Key trends and patterns in power markets
-            2. **Regional Analysis**: Regional price variations and supply-demand dynamics
-            3. **Weather Impact**: How weather conditions affected energy demand and pricing
-            4. **Economic Factors**: Impact of commodity prices and economic indicators
-            5. **Risk Assessment**: Potential market risks and volatility factors
-            6. **Strategic Recommendations**: Actionable insights for energy market participants
-            7. **Outlook**: Short-term forecast and key factors to monitor
-
-            Please structure your response in clear sections with specific data points and actionable recommendations.
-            Focus on practical insights that would be valuable for energy market participants.
-            """
-            
-            message = self.claude_client.messages.create(
-                model="claude-3-sonnet-20240229",
-                max_tokens=4000,
-                temperature=0.3,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
+            # Prepare a compact data summary for Claude - prompt size drives
+            # both token cost and round-trip time
+            data_summary = self._compact_summary(analysis_data)
+            data_summary['analysis_timestamp'] = datetime.utcnow().isoformat()
+
+            prompt = CLAUDE_PROMPT_TEMPLATE.format(
+                data_summary=orjson.dumps(
+                    data_summary, default=str,
+                    option=orjson.OPT_SERIALIZE_NUMPY
+                ).decode()
+            )
+
+            # The SDK call blocks, so push it onto a worker thread - callers
+            # can then overlap it with visualization and report layout
+            loop = asyncio.get_running_loop()
+            message = await loop.run_in_executor(
+                None,
+                lambda: self.claude_client.messages.create(
+                    model="claude-3-sonnet-20240229",
+                    max_tokens=4000,
+                    temperature=0.3,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ]
+                )
             )
             
             insights = message.content[0].text
@@ -365,13 +655,15 @@ class EnergyMarketAnalyzer:
         
         try:
             # Power market price trends
-            if 'power_markets' in analysis_data and analysis_data['power_markets'].get('regional_analysis'):
-                fig, ax = plt.subplots(figsize=(12, 8))
-                
-                regional_data = analysis_data['power_markets']['regional_analysis']
-                regions = list(regional_data.keys())
-                avg_prices = [regional_data[region]['price']['mean'] for region in regions]
-                price_volatility = [regional_data[region]['price']['std'] for region in regions]
+            regional_data = analysis_data.get('power_markets', {}).get('regional_analysis')
+            if regional_data is not None and len(regional_data):
+                self._fig.clear()
+                self._fig.set_size_inches(12, 8)
+                ax = self._fig.add_subplot(111)
+
+                regions = list(regional_data.index)
+                avg_prices = regional_data[('price', 'mean')].to_numpy()
+                price_volatility = regional_data[('price', 'std')].to_numpy()
                 
                 x = np.arange(len(regions))
                 width = 0.35
@@ -387,31 +679,27 @@ class EnergyMarketAnalyzer:
                 ax.legend()
                 ax.grid(True, alpha=0.3)
                 
-                # Add value labels on bars
-                for bar in bars1:
-                    height = bar.get_height()
-                    ax.text(bar.get_x() + bar.get_width()/2., height,
-                           f'${height:.2f}', ha='center', va='bottom')
+                # Add value labels on bars in one call per container
+                ax.bar_label(bars1, fmt='${:.2f}', padding=2)
+                ax.bar_label(bars2, fmt='{:.2f}', padding=2)
                 
-                for bar in bars2:
-                    height = bar.get_height()
-                    ax.text(bar.get_x() + bar.get_width()/2., height,
-                           f'{height:.2f}', ha='center', va='bottom')
-                
-                plt.tight_layout()
+                self._fig.tight_layout()
                 viz_file = self.output_dir / 'power_market_analysis.png'
-                plt.savefig(viz_file, dpi=300, bbox_inches='tight')
-                plt.close()
+                # 150 dpi: the PDF embeds the image at 500x300pt, so higher
+                # resolutions just cost encode time and bytes
+                self._canvas.print_figure(str(viz_file), dpi=150, bbox_inches='tight')
                 viz_files.append(str(viz_file))
                 logger.info("Power market visualization created")
             
             # Economic indicators chart
-            if 'economic_indicators' in analysis_data and analysis_data['economic_indicators'].get('market_indicators'):
-                fig, ax = plt.subplots(figsize=(12, 6))
-                
-                indicators = analysis_data['economic_indicators']['market_indicators']
-                indicator_names = list(indicators.keys())
-                values = [indicators[ind]['mean'] for ind in indicator_names]
+            indicators = analysis_data.get('economic_indicators', {}).get('market_indicators')
+            if indicators is not None and len(indicators):
+                self._fig.clear()
+                self._fig.set_size_inches(12, 6)
+                ax = self._fig.add_subplot(111)
+
+                indicator_names = list(indicators.index)
+                values = indicators['mean'].to_numpy()
                 
                 bars = ax.barh(indicator_names, values, alpha=0.8)
                 ax.set_xlabel('Value')
@@ -419,15 +707,11 @@ class EnergyMarketAnalyzer:
                 ax.grid(True, alpha=0.3)
                 
                 # Add value labels
-                for i, bar in enumerate(bars):
-                    width = bar.get_width()
-                    ax.text(width, bar.get_y() + bar.get_height()/2,
-                           f'{width:.2f}', ha='left', va='center')
+                ax.bar_label(bars, fmt='{:.2f}', padding=2)
                 
-                plt.tight_layout()
+                self._fig.tight_layout()
                 viz_file = self.output_dir / 'economic_indicators.png'
-                plt.savefig(viz_file, dpi=300, bbox_inches='tight')
-                plt.close()
+                self._canvas.print_figure(str(viz_file), dpi=150, bbox_inches='tight')
                 viz_files.append(str(viz_file))
                 logger.info("Economic indicators visualization created")
             
@@ -498,19 +782,18 @@ class EnergyMarketAnalyzer:
             story.append(Paragraph("Data Appendix", styles['Heading2']))
             
             # Power markets data table
-            if 'power_markets' in analysis_data and analysis_data['power_markets'].get('regional_analysis'):
+            regional_data = analysis_data.get('power_markets', {}).get('regional_analysis')
+            if regional_data is not None and len(regional_data):
                 story.append(Paragraph("Regional Power Market Data", styles['Heading3']))
-                
-                regional_data = analysis_data['power_markets']['regional_analysis']
+
                 table_data = [['Region', 'Avg Price ($/MWh)', 'Volatility', 'Avg Demand (MW)']]
-                
-                for region in regional_data.keys():
-                    data = regional_data[region]
+
+                for region in regional_data.index:
                     table_data.append([
                         region,
-                        f"${data['price']['mean']:.2f}",
-                        f"{data['price']['std']:.2f}",
-                        f"{data['demand']['mean']:,.0f}"
+                        f"${regional_data.loc[region, ('price', 'mean')]:.2f}",
+                        f"{regional_data.loc[region, ('price', 'std')]:.2f}",
+                        f"{regional_data.loc[region, ('demand', 'mean')]:,.0f}"
                     ])
                 
                 table = Table(table_data)
@@ -554,7 +837,7 @@ class EnergyMarketAnalyzer:
             json_key = f"reports/json/weekly_analysis_{timestamp}.json"
             analysis_json = {
                 'timestamp': datetime.utcnow().isoformat(),
-                'analysis_data': analysis_data,
+                'analysis_data': _to_serializable(analysis_data),
                 'claude_insights': claude_insights,
                 'metadata': {
                     'environment': ENVIRONMENT,
@@ -562,42 +845,49 @@ class EnergyMarketAnalyzer:
                 }
             }
             
+            # orjson serializes the numpy scalars in the analysis dicts
+            # natively in C; no indentation keeps the object compact
             s3_client.put_object(
                 Bucket=self.s3_bucket,
                 Key=json_key,
-                Body=json.dumps(analysis_json, default=str, indent=2),
+                Body=orjson.dumps(
+                    analysis_json, default=str,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+                ),
                 ContentType='application/json',
                 ServerSideEncryption='AES256'
             )
             logger.info(f"JSON analysis saved to s3://{self.s3_bucket}/{json_key}")
             
-            # Save PDF report
+            # Upload report artifacts - stream each file multipart instead of
+            # reading it into memory, and let the uploads overlap
+            uploads = []
+
             if pdf_file and Path(pdf_file).exists():
                 pdf_key = f"reports/pdf/weekly_report_{timestamp}.pdf"
-                with open(pdf_file, 'rb') as f:
-                    s3_client.put_object(
-                        Bucket=self.s3_bucket,
-                        Key=pdf_key,
-                        Body=f.read(),
-                        ContentType='application/pdf',
-                        ServerSideEncryption='AES256'
-                    )
-                logger.info(f"PDF report saved to s3://{self.s3_bucket}/{pdf_key}")
-            
-            # Save visualizations
+                uploads.append((pdf_file, pdf_key, 'application/pdf'))
+
             for viz_file in viz_files:
                 if Path(viz_file).exists():
                     viz_key = f"reports/visualizations/{Path(viz_file).name}_{timestamp}"
-                    with open(viz_file, 'rb') as f:
-                        s3_client.put_object(
-                            Bucket=self.s3_bucket,
-                            Key=viz_key,
-                            Body=f.read(),
-                            ContentType='image/png',
-                            ServerSideEncryption='AES256'
-                        )
-                    logger.info(f"Visualization saved to s3://{self.s3_bucket}/{viz_key}")
-            
+                    uploads.append((viz_file, viz_key, 'image/png'))
+
+            def _upload(local_path: str, key: str, content_type: str):
+                s3_client.upload_file(
+                    local_path, self.s3_bucket, key,
+                    ExtraArgs={
+                        'ContentType': content_type,
+                        'ServerSideEncryption': 'AES256'
+                    },
+                    Config=S3_TRANSFER_CONFIG
+                )
+                logger.info(f"Report artifact saved to s3://{self.s3_bucket}/{key}")
+
+            if uploads:
+                with ThreadPoolExecutor(max_workers=len(uploads)) as pool:
+                    for future in [pool.submit(_upload, *args) for args in uploads]:
+                        future.result()
+
             return True
             
         except Exception as e:
@@ -612,6 +902,7 @@ class EnergyMarketAnalyzer:
             item = {
                 'data_source': 'weekly_analysis',
                 'timestamp': timestamp,
+                'day': timestamp[:10],  # partition key of the by-day-ts GSI
                 'success': success,
                 'analysis_type': 'comprehensive_market_analysis',
                 'environment': ENVIRONMENT,
@@ -640,31 +931,43 @@ class EnergyMarketAnalyzer:
             if not datasets:
                 raise Exception("No data available for analysis")
             
-            # Step 2: Perform individual analyses
+            # Step 2: Perform individual analyses - they are independent, so
+            # run them side by side on the analysis pool
             logger.info("Step 2: Performing market analysis")
-            analysis_results = {}
-            
+            loop = asyncio.get_running_loop()
+            analysis_tasks = {}
+
             if 'lseg' in datasets:
-                analysis_results['power_markets'] = self.analyze_power_markets(datasets['lseg'])
-            
+                analysis_tasks['power_markets'] = loop.run_in_executor(
+                    self._analysis_pool, self.analyze_power_markets, datasets['lseg']
+                )
+
             if 'weather' in datasets:
-                weather_analysis = self.analyze_weather_impact(
-                    datasets['weather'], 
-                    datasets.get('lseg', pd.DataFrame())
+                analysis_tasks['weather_impact'] = loop.run_in_executor(
+                    self._analysis_pool, self.analyze_weather_impact,
+                    datasets['weather'], datasets.get('lseg', pd.DataFrame())
                 )
-                analysis_results['weather_impact'] = weather_analysis
-            
+
             if 'economic' in datasets:
-                analysis_results['economic_indicators'] = self.analyze_economic_indicators(datasets['economic'])
-            
-            # Step 3: Generate AI insights
+                analysis_tasks['economic_indicators'] = loop.run_in_executor(
+                    self._analysis_pool, self.analyze_economic_indicators, datasets['economic']
+                )
+
+            analysis_results = dict(zip(
+                analysis_tasks.keys(),
+                await asyncio.gather(*analysis_tasks.values())
+            ))
+
+            # Steps 3-4: the Claude round-trip is pure I/O, so start it and
+            # render the visualizations while it is in flight
             logger.info("Step 3: Generating Claude AI insights")
-            claude_insights = await self.generate_claude_insights(analysis_results)
-            
-            # Step 4: Create visualizations
+            claude_task = asyncio.create_task(self.generate_claude_insights(analysis_results))
+
             logger.info("Step 4: Creating visualizations")
-            viz_files = self.create_visualizations(analysis_results)
-            
+            viz_files = await loop.run_in_executor(None, self.create_visualizations, analysis_results)
+
+            claude_insights = await claude_task
+
             # Step 5: Generate PDF report
             logger.info("Step 5: Generating PDF report")
             pdf_file = self.generate_pdf_report(analysis_results, claude_insights, viz_files)
@@ -5,13 +5,24 @@ Securely downloads power market data from LSEG SFTP servers
 """
 
 import os
+import hashlib
 import logging
-import json
+import queue
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from io import StringIO
+
 import paramiko
 import boto3
-import pandas as pd
-from io import StringIO
+from boto3.dynamodb.conditions import Key
+from botocore.config import Config
+from botocore.exceptions import ClientError
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
 
 # Configure logging
 logging.basicConfig(
@@ -20,47 +31,133 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# SSH key cached per process - one SSM GetParameter (plus KMS decrypt) and
+# one RSA key parse, no matter how many worker sessions connect_sftp opens
+_SSH_KEY_CACHE = None
+_PARSED_KEY_CACHE = None
+
+# Explicit Arrow types for the LSEG CSV columns we know. Low-cardinality
+# string columns are dictionary-encoded at parse time, so Parquet stores
+# integer indices instead of repeated strings; unknown columns still go
+# through Arrow's normal inference. Timestamps stay as ISO-8601 strings -
+# that is what the rest of the pipeline stores and compares.
+LSEG_COLUMN_TYPES = {
+    'region': pa.dictionary(pa.int32(), pa.string()),
+    'data_type': pa.dictionary(pa.int32(), pa.string()),
+    'currency': pa.dictionary(pa.int8(), pa.string()),
+    'unit': pa.dictionary(pa.int8(), pa.string()),
+    'price_eur_mwh': pa.float64(),
+    'volume_mwh': pa.float64(),
+}
+
+class _HashingReader:
+    """File-like wrapper that hashes every chunk as it is read
+
+    Sits between the SFTP file object and the CSV reader, so the content
+    hash comes for free out of bytes that are already in flight instead of
+    a second full pass over the file.
+
+    Arrow wraps this in a PythonFile, which requires the file protocol
+    (``closed``, ``close()``, ``seekable()``) in addition to ``read()``;
+    those delegate to the wrapped file. Not seekable - the stream is
+    consumed exactly once, which is what keeps the hash single-pass.
+    """
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._hash = hashlib.blake2b(digest_size=16)
+
+    @property
+    def closed(self):
+        return self._raw.closed
+
+    def close(self):
+        self._raw.close()
+
+    def seekable(self):
+        return False
+
+    def read(self, size=-1):
+        chunk = self._raw.read(size)
+        if chunk:
+            self._hash.update(chunk)
+        return chunk
+
+    def hexdigest(self):
+        return self._hash.hexdigest()
+
 class LSEGSFTPCollector:
     def __init__(self):
-        self.s3_client = boto3.client('s3')
-        self.ssm_client = boto3.client('ssm')
-        self.dynamodb = boto3.resource('dynamodb')
-        
+        # Pooled, keep-alive AWS clients shared by all workers - without an
+        # explicit pool size the concurrent uploads serialize on sockets
+        aws_config = Config(
+            tcp_keepalive=True,
+            max_pool_connections=32,
+            retries={'max_attempts': 10, 'mode': 'adaptive'},
+            connect_timeout=3,
+            read_timeout=10
+        )
+        self.dynamodb = boto3.resource('dynamodb', config=aws_config)
+
+        # File metadata queued here and flushed in one batched write
+        self._pending_metadata = []
+
+        # Arrow filesystem for streaming Parquet writes - parts go to S3 as
+        # multipart uploads while the CSV is still being parsed
+        self._s3fs = pafs.S3FileSystem(
+            region=os.environ.get('AWS_REGION', 'us-east-1')
+        )
+
         # Environment variables
         self.s3_bucket = os.environ.get('S3_BUCKET', 'nexus-ena-data-lake-prod')
         self.dynamodb_table = os.environ.get('DYNAMODB_TABLE', 'nexus-ena-metadata-prod')
         self.sftp_host = os.environ.get('SFTP_HOST')
         self.sftp_port = int(os.environ.get('SFTP_PORT', '22'))
         self.sftp_username = os.environ.get('SFTP_USERNAME')
-        
+        self.sftp_concurrency = int(os.environ.get('SFTP_CONCURRENCY', '8'))
+
         # SSH key from AWS Systems Manager
         self.ssh_key_parameter = '/nexus-ena/sftp-private-key'
+
+        # Directory the day's files were listed from; list_available_files
+        # narrows this when the server has a per-date subdirectory
+        self._remote_data_path = '/data'
         
     def get_ssh_key(self):
-        """Retrieve SSH private key from AWS Systems Manager"""
+        """Retrieve SSH private key from AWS Systems Manager (cached)"""
+        global _SSH_KEY_CACHE
+        if _SSH_KEY_CACHE is not None:
+            return _SSH_KEY_CACHE
         try:
-            response = self.ssm_client.get_parameter(
+            # Built on demand - the key is fetched once per task, so there is
+            # no reason to pay for the client at construction time
+            ssm_client = boto3.client('ssm')
+            response = ssm_client.get_parameter(
                 Name=self.ssh_key_parameter,
                 WithDecryption=True
             )
-            return response['Parameter']['Value']
+            _SSH_KEY_CACHE = response['Parameter']['Value']
+            return _SSH_KEY_CACHE
         except Exception as e:
             logger.error(f"Failed to retrieve SSH key: {str(e)}")
             raise
     
     def connect_sftp(self):
         """Establish SFTP connection using SSH key authentication"""
+        global _PARSED_KEY_CACHE
         try:
-            # Get SSH key
-            private_key_content = self.get_ssh_key()
-            
+            # Parse the private key once - the RSA math is CPU-bound and the
+            # session pool opens several connections per run
+            if _PARSED_KEY_CACHE is None:
+                _PARSED_KEY_CACHE = paramiko.RSAKey.from_private_key(
+                    StringIO(self.get_ssh_key())
+                )
+            key = _PARSED_KEY_CACHE
+
             # Create SSH client
             ssh_client = paramiko.SSHClient()
             ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
             
-            # Load private key
-            key = paramiko.RSAKey.from_private_key(StringIO(private_key_content))
-            
             # Connect
             ssh_client.connect(
                 hostname=self.sftp_host,
@@ -85,12 +182,23 @@ class LSEGSFTPCollector:
         try:
             today = datetime.now().strftime('%Y%m%d')
             files = []
-            
-            # List files in remote directory
-            for filename in sftp_client.listdir(remote_path):
+
+            # If the server partitions drops by date, list only today's
+            # subdirectory instead of the whole accumulating directory
+            try:
+                sftp_client.stat(f"{remote_path}/{today}")
+                remote_path = f"{remote_path}/{today}"
+            except IOError:
+                pass
+            self._remote_data_path = remote_path
+
+            # listdir_iter streams the name responses lazily rather than
+            # materialising every historical entry before filtering
+            for attr in sftp_client.listdir_iter(remote_path):
+                filename = attr.filename
                 if today in filename and filename.endswith('.csv'):
                     files.append(filename)
-            
+
             logger.info(f"Found {len(files)} files for {today}")
             return files
             
@@ -98,108 +206,264 @@ class LSEGSFTPCollector:
             logger.error(f"Failed to list files: {str(e)}")
             return []
     
-    def download_and_process_file(self, sftp_client, remote_file, remote_path='/data'):
+    def _discard_staging(self, staging_key):
+        """Best-effort removal of an incomplete staging object
+
+        Nothing may exist at the key if the upload never finalized, and a
+        failed delete must not mask the error that got us here.
+        """
+        try:
+            self._s3fs.delete_file(f"{self.s3_bucket}/{staging_key}")
+        except Exception:
+            pass
+
+    def _append_metadata_columns(self, batch, collection_timestamp, source_file):
+        """Append the collection metadata columns to a CSV record batch"""
+        arrays = batch.columns + [
+            pa.array([collection_timestamp] * batch.num_rows, type=pa.string()),
+            pa.array([source_file] * batch.num_rows, type=pa.string())
+        ]
+        names = batch.schema.names + ['collection_timestamp', 'source_file']
+        return pa.RecordBatch.from_arrays(arrays, names=names)
+
+    def download_and_process_file(self, sftp_client, remote_file, remote_path=None):
         """Download file from SFTP and convert to Parquet format"""
         try:
-            remote_filepath = f"{remote_path}/{remote_file}"
-            
-            # Download file content
-            with sftp_client.file(remote_filepath, 'r') as remote_file_obj:
-                csv_content = remote_file_obj.read().decode('utf-8')
-            
-            # Convert CSV to DataFrame
-            df = pd.read_csv(StringIO(csv_content))
-            
-            # Add metadata columns
-            df['collection_timestamp'] = datetime.utcnow().isoformat()
-            df['source_file'] = remote_file
-            
-            # Convert to Parquet
-            parquet_buffer = df.to_parquet(index=False)
-            
+            remote_filepath = f"{remote_path or self._remote_data_path}/{remote_file}"
+            collection_timestamp = datetime.utcnow().isoformat()
+
+            # Cheap change detection: if the size+mtime etag matches what we
+            # recorded last run, the file is unchanged and a re-run costs one
+            # stat call instead of a full download. The table is keyed by
+            # data_source/timestamp, so the file's latest record comes from
+            # the file-keyed GSI
+            attr = sftp_client.stat(remote_filepath)
+            etag = f"{remote_file}:{attr.st_size}:{attr.st_mtime}"
+            try:
+                matches = self.dynamodb.Table(self.dynamodb_table).query(
+                    IndexName='by-file-ts',
+                    KeyConditionExpression=Key('file_id').eq(remote_file),
+                    ScanIndexForward=False,
+                    Limit=1
+                ).get('Items', [])
+                if matches and matches[0].get('etag') == etag:
+                    logger.info(f"Skipping unchanged file: {remote_file}")
+                    return matches[0].get('s3_location')
+            except Exception as e:
+                logger.warning(f"Idempotency check failed for {remote_file}: {str(e)}")
+
             # Generate S3 key
             date_prefix = datetime.now().strftime('%Y/%m/%d')
-            s3_key = f"raw-data/{date_prefix}/lseg_{remote_file.replace('.csv', '.parquet')}"
-            
-            # Upload to S3
-            self.s3_client.put_object(
-                Bucket=self.s3_bucket,
-                Key=s3_key,
-                Body=parquet_buffer,
-                ServerSideEncryption='AES256'
-            )
-            
+            parquet_name = f"lseg_{remote_file.replace('.csv', '.parquet')}"
+            s3_key = f"raw-data/{date_prefix}/{parquet_name}"
+
+            # Stream CSV batches straight from the SFTP file object into a
+            # Parquet writer on an S3 output stream - Arrow multiparts the
+            # upload while the CSV is still being parsed, so the file is
+            # never buffered whole in memory.
+            #
+            # The stream finalizes its upload on close(), which the with
+            # block does on every exit path - so an empty parse or a
+            # mid-parse error would leave a truncated object behind. The
+            # write therefore targets a staging key outside raw-data/ (the
+            # analyzer only scans raw-data/) and is only moved to the final
+            # key once the writer has closed cleanly.
+            staging_key = f"staging/{date_prefix}/{parquet_name}"
+            writer = None
+            record_count = 0
+            file_size = attr.st_size
+            complete = False
+
+            try:
+                with sftp_client.file(remote_filepath, 'rb') as remote_file_obj, \
+                        self._s3fs.open_output_stream(
+                            f"{self.s3_bucket}/{staging_key}",
+                            metadata={'source_file': remote_file}
+                        ) as parquet_sink:
+                    # Pipeline the SFTP READ requests so throughput is no
+                    # longer capped at one 32 KiB chunk per server round-trip
+                    remote_file_obj.prefetch(file_size)
+                    hashing_reader = _HashingReader(remote_file_obj)
+                    reader = pacsv.open_csv(
+                        hashing_reader,
+                        read_options=pacsv.ReadOptions(block_size=8 << 20),
+                        convert_options=pacsv.ConvertOptions(
+                            column_types=LSEG_COLUMN_TYPES
+                        )
+                    )
+
+                    for batch in reader:
+                        batch = self._append_metadata_columns(
+                            batch, collection_timestamp, remote_file
+                        )
+                        if writer is None:
+                            writer = pq.ParquetWriter(
+                                parquet_sink, batch.schema,
+                                compression='zstd', compression_level=3,
+                                use_dictionary=True,
+                                data_page_size=1 << 20
+                            )
+                        writer.write_batch(batch)
+                        record_count += batch.num_rows
+
+                    if writer is not None:
+                        writer.close()
+                        complete = True
+            finally:
+                if not complete:
+                    self._discard_staging(staging_key)
+
+            if not complete:
+                logger.warning(f"No rows parsed from {remote_file}")
+                return None
+
+            self._s3fs.move(f"{self.s3_bucket}/{staging_key}",
+                            f"{self.s3_bucket}/{s3_key}")
             logger.info(f"Successfully processed and uploaded: {s3_key}")
-            
+
             # Update metadata in DynamoDB
-            self.update_metadata(remote_file, s3_key, len(df))
-            
+            self.update_metadata(remote_file, s3_key, record_count,
+                                 hashing_reader.hexdigest(), etag,
+                                 collection_timestamp)
+
             return s3_key
-            
+
         except Exception as e:
             logger.error(f"Failed to process file {remote_file}: {str(e)}")
             return None
     
-    def update_metadata(self, filename, s3_key, record_count):
-        """Update file metadata in DynamoDB"""
-        try:
-            table = self.dynamodb.Table(self.dynamodb_table)
-            
-            table.put_item(
-                Item={
-                    'file_id': filename,
-                    'collection_date': datetime.now().strftime('%Y-%m-%d'),
-                    's3_location': s3_key,
-                    'record_count': record_count,
-                    'status': 'completed',
-                    'timestamp': datetime.utcnow().isoformat(),
-                    'source': 'lseg_sftp'
-                }
-            )
-            
-            logger.info(f"Metadata updated for {filename}")
-            
-        except Exception as e:
-            logger.error(f"Failed to update metadata: {str(e)}")
+    def update_metadata(self, filename, s3_key, record_count, data_hash=None,
+                        etag=None, timestamp=None):
+        """Queue file metadata for a batched DynamoDB write
+
+        The caller passes its collection timestamp so the metadata row and
+        the Parquet metadata columns carry the same instant.
+        """
+        timestamp = timestamp or datetime.utcnow().isoformat()
+        self._pending_metadata.append({
+            # Table keys: every SFTP file shares the lseg_sftp partition,
+            # ordered by its per-file collection timestamp
+            'data_source': 'lseg_sftp',
+            'timestamp': timestamp,
+            'file_id': filename,  # partition key of the by-file-ts GSI
+            'collection_date': timestamp[:10],
+            's3_location': s3_key,
+            'record_count': record_count,
+            'data_hash': data_hash,
+            'etag': etag,
+            'status': 'completed',
+            'success': True,  # only completed files are queued; the API indexes this
+            'day': timestamp[:10],  # partition key of the by-day-ts GSI
+            'source': 'lseg_sftp'
+        })
+
+    # Error codes worth retrying with backoff - anything else fails fast
+    _RETRYABLE_DYNAMO_ERRORS = {
+        'ProvisionedThroughputExceededException',
+        'ThrottlingException',
+        'InternalServerError'
+    }
+
+    def flush_metadata(self):
+        """Write all queued metadata in one BatchWriteItem pass
+
+        The whole batch is the day's collection record, so throttling gets
+        retried with exponential backoff and jitter rather than dropped.
+        """
+        if not self._pending_metadata:
+            return
+
+        table = self.dynamodb.Table(self.dynamodb_table)
+
+        for attempt in range(5):
+            try:
+                with table.batch_writer(
+                        overwrite_by_pkeys=['data_source', 'timestamp']) as batch:
+                    for item in self._pending_metadata:
+                        batch.put_item(Item=item)
+
+                logger.info(f"Metadata updated for {len(self._pending_metadata)} files")
+                self._pending_metadata = []
+                return
+
+            except ClientError as e:
+                error_code = e.response['Error']['Code']
+                if error_code not in self._RETRYABLE_DYNAMO_ERRORS or attempt == 4:
+                    logger.error(f"Failed to update metadata: {str(e)}")
+                    return
+                delay = min(30, 2 ** attempt) + random.uniform(0, 1)
+                logger.warning(
+                    f"Metadata flush throttled ({error_code}), "
+                    f"retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+
+            except Exception as e:
+                logger.error(f"Failed to update metadata: {str(e)}")
+                return
     
+    def _process_with_session(self, session_pool, filename):
+        """Check out an SFTP session, process one file, return the session"""
+        ssh_client, sftp_client = session_pool.get()
+        try:
+            return self.download_and_process_file(sftp_client, filename)
+        finally:
+            session_pool.put((ssh_client, sftp_client))
+
     def collect_daily_data(self):
         """Main collection process"""
-        ssh_client = None
-        sftp_client = None
-        
+        connections = []
+
         try:
             logger.info("Starting LSEG SFTP data collection")
-            
+
             # Connect to SFTP
-            ssh_client, sftp_client = self.connect_sftp()
-            
+            connections.append(self.connect_sftp())
+
             # List available files
-            files = self.list_available_files(sftp_client)
-            
+            files = self.list_available_files(connections[0][1])
+
             if not files:
                 logger.warning("No files found for today")
                 return
-            
-            # Process each file
+
+            # Process the daily batch concurrently - paramiko SFTP clients
+            # are not thread-safe, so each worker checks a session out of a
+            # pool rather than sharing one
+            worker_count = max(1, min(self.sftp_concurrency, len(files)))
+            while len(connections) < worker_count:
+                connections.append(self.connect_sftp())
+
+            session_pool = queue.Queue()
+            for connection in connections:
+                session_pool.put(connection)
+
             processed_files = []
-            for filename in files:
-                s3_key = self.download_and_process_file(sftp_client, filename)
-                if s3_key:
-                    processed_files.append(s3_key)
-            
+            with ThreadPoolExecutor(max_workers=worker_count) as pool:
+                futures = {
+                    pool.submit(self._process_with_session, session_pool, filename): filename
+                    for filename in files
+                }
+                for future in as_completed(futures):
+                    s3_key = future.result()
+                    if s3_key:
+                        processed_files.append(s3_key)
+
+            # Flush the queued per-file metadata in one batched write
+            self.flush_metadata()
+
             logger.info(f"Collection completed. Processed {len(processed_files)} files")
-            
+
         except Exception as e:
             logger.error(f"Collection failed: {str(e)}")
             raise
-            
+
         finally:
             # Clean up connections
-            if sftp_client:
+            for ssh_client, sftp_client in connections:
                 sftp_client.close()
-            if ssh_client:
                 ssh_client.close()
-            
+
             logger.info("SFTP connections closed")
 
 def main():
@@ -0,0 +1,36 @@
+"""Regression tests for the SFTP data collector"""
+
+import hashlib
+import io
+
+import pyarrow.csv as pacsv
+
+from sftp_data_collector import _HashingReader
+
+
+def test_hashing_reader_round_trips_csv_through_arrow():
+    """pyarrow's PythonFile wrapper needs the file protocol, not just read()
+
+    A wrapper without ``closed``/``close()``/``seekable()`` makes
+    pacsv.open_csv raise before the first batch, so every download fails.
+    """
+    data = b"region,price_eur_mwh\nDE,45.2\nFR,51.7\n"
+    reader = _HashingReader(io.BytesIO(data))
+
+    table = pacsv.open_csv(reader).read_all()
+
+    assert table.num_rows == 2
+    assert table.column_names == ['region', 'price_eur_mwh']
+    # The hash covers exactly the bytes the CSV reader consumed
+    assert reader.hexdigest() == hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def test_hashing_reader_delegates_close():
+    raw = io.BytesIO(b"a,b\n1,2\n")
+    reader = _HashingReader(raw)
+
+    assert not reader.closed
+    assert not reader.seekable()
+    reader.close()
+    assert reader.closed
+    assert raw.closed
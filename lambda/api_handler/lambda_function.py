@@ -3,10 +3,16 @@ NEXUS_ENA API Handler Lambda Function
 Handles API Gateway requests for the NEXUS_ENA dashboard
 """
 
+import gzip
 import json
+import orjson
 import boto3
+from boto3.dynamodb.conditions import Key
+from botocore.config import Config
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import base64
@@ -16,27 +22,68 @@ from decimal import Decimal
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-# AWS clients
-s3_client = boto3.client('s3')
-dynamodb = boto3.resource('dynamodb')
+# AWS clients - keep-alive and a sized pool so warm invocations reuse the
+# HTTPS connections instead of re-handshaking
+_boto_cfg = Config(
+    tcp_keepalive=True,
+    max_pool_connections=64,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    connect_timeout=3,
+    read_timeout=10
+)
+s3_client = boto3.client('s3', config=_boto_cfg)
+dynamodb = boto3.resource('dynamodb', config=_boto_cfg)
 
 # Environment variables
 S3_BUCKET = os.environ['S3_BUCKET']
 DYNAMODB_TABLE = os.environ['DYNAMODB_TABLE']
 ENVIRONMENT = os.environ.get('ENVIRONMENT', 'prod')
 
-class DecimalEncoder(json.JSONEncoder):
-    """JSON encoder for DynamoDB Decimal types"""
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return float(obj)
-        return super(DecimalEncoder, self).default(obj)
+# Time-bucketed GSI written by the collectors: hash key 'day', range key
+# 'timestamp'. Lets the API query the relevant day partitions instead of
+# scanning the whole table.
+DAY_INDEX = 'by-day-ts'
+
+# In-process response cache. Collection runs at most every few minutes, so
+# repeated dashboard polls in the same warm container can reuse the last
+# response instead of re-querying DynamoDB.
+_CACHE: Dict[str, tuple] = {}
+
+def _cached(key: str, ttl: float, fn):
+    """Return fn()'s response, reusing a cached copy younger than ttl seconds
+
+    Only successful responses are cached; errors always re-run.
+    """
+    now = time.monotonic()
+    entry = _CACHE.get(key)
+    if entry and now - entry[0] < ttl:
+        return entry[1]
+    response = fn()
+    if response.get('statusCode') == 200:
+        _CACHE[key] = (now, response)
+    return response
+
+def _json_default(obj):
+    """orjson fallback for DynamoDB Decimals and datetime-likes"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    return str(obj)
 
 class APIHandler:
     """Main API handler class"""
     
     def __init__(self):
         self.table = dynamodb.Table(DYNAMODB_TABLE)
+        # Pool for fanning out per-object S3 HEAD requests
+        self._s3_meta_pool = ThreadPoolExecutor(max_workers=32)
+        # Set per invocation from the request's Accept-Encoding header
+        # (Lambda containers handle one request at a time)
+        self.accepts_gzip = False
+        # Stamped once per invocation so every field in a response carries
+        # the same instant
+        self.request_time = datetime.utcnow().isoformat()
     
     def get_cors_headers(self) -> Dict[str, str]:
         """Get CORS headers for API responses"""
@@ -52,33 +99,75 @@ class APIHandler:
         response_headers = self.get_cors_headers()
         if headers:
             response_headers.update(headers)
-        
+
+        body_json = orjson.dumps(body, default=_json_default).decode()
+
+        # Gzip the body when the client accepts it - dashboard payloads are
+        # tens of KB of redundant JSON, so even compresslevel=1 cuts them
+        # 5-10x. API Gateway forwards the binary body via base64.
+        if self.accepts_gzip:
+            body_bytes = gzip.compress(body_json.encode(), compresslevel=1)
+            response_headers['Content-Encoding'] = 'gzip'
+            return {
+                'statusCode': status_code,
+                'headers': response_headers,
+                'body': base64.b64encode(body_bytes).decode(),
+                'isBase64Encoded': True
+            }
+
         return {
             'statusCode': status_code,
             'headers': response_headers,
-            'body': json.dumps(body, cls=DecimalEncoder, default=str)
+            'body': body_json
         }
     
     def handle_options(self) -> Dict:
         """Handle CORS preflight OPTIONS requests"""
         return self.create_response(200, {'message': 'CORS preflight successful'})
     
+    def _query_recent_items(self, days: int) -> List[Dict]:
+        """Query the day-partitioned GSI for all items in the lookback window
+
+        One query per day partition, issued in parallel; O(result) reads
+        instead of the O(table) cost of a filtered scan.
+        """
+        now = datetime.utcnow()
+        cutoff = (now - timedelta(days=days)).isoformat()
+        day_keys = [(now - timedelta(days=offset)).strftime('%Y-%m-%d')
+                    for offset in range(days + 1)]
+
+        def _query_day(day: str) -> List[Dict]:
+            # Follow LastEvaluatedKey so day partitions past the 1 MB
+            # response cap aren't silently truncated
+            day_items = []
+            query_kwargs = {
+                'IndexName': DAY_INDEX,
+                'KeyConditionExpression':
+                    Key('day').eq(day) & Key('timestamp').gt(cutoff)
+            }
+            while True:
+                response = self.table.query(**query_kwargs)
+                day_items.extend(response['Items'])
+                last_key = response.get('LastEvaluatedKey')
+                if not last_key:
+                    return day_items
+                query_kwargs['ExclusiveStartKey'] = last_key
+
+        items = []
+        with ThreadPoolExecutor(max_workers=len(day_keys)) as pool:
+            for day_items in pool.map(_query_day, day_keys):
+                items.extend(day_items)
+        return items
+
     def get_data_sources_status(self) -> Dict:
         """Get status of all data sources"""
         try:
             # Query recent data collection status
-            response = self.table.scan(
-                FilterExpression='#ts > :timestamp',
-                ExpressionAttributeNames={'#ts': 'timestamp'},
-                ExpressionAttributeValues={
-                    ':timestamp': (datetime.utcnow() - timedelta(days=7)).isoformat()
-                },
-                Limit=100
-            )
-            
+            items = self._query_recent_items(days=7)
+
             # Group by data source
             sources_status = {}
-            for item in response['Items']:
+            for item in items:
                 source = item['data_source']
                 if source not in sources_status:
                     sources_status[source] = {
@@ -104,8 +193,8 @@ class APIHandler:
             return self.create_response(200, {
                 'data_sources': list(sources_status.values()),
                 'total_sources': len(sources_status),
-                'timestamp': datetime.utcnow().isoformat()
-            })
+                'timestamp': self.request_time
+            }, headers={'Cache-Control': 'max-age=30'})
             
         except Exception as e:
             logger.error(f"Failed to get data sources status: {str(e)}")
@@ -139,7 +228,7 @@ class APIHandler:
                 'data_source': data_source,
                 'recent_collections': recent_data,
                 'count': len(recent_data),
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': self.request_time
             })
             
         except Exception as e:
@@ -152,24 +241,22 @@ class APIHandler:
     def get_dashboard_summary(self) -> Dict:
         """Get summary data for dashboard"""
         try:
-            # Get data from last 24 hours
-            yesterday = datetime.utcnow() - timedelta(days=1)
-            
-            response = self.table.scan(
-                FilterExpression='#ts > :timestamp',
-                ExpressionAttributeNames={'#ts': 'timestamp'},
-                ExpressionAttributeValues={
-                    ':timestamp': yesterday.isoformat()
-                }
-            )
-            
-            # Calculate summary statistics
-            total_collections = len(response['Items'])
-            successful_collections = sum(1 for item in response['Items'] if item['success'])
-            total_records = sum(item.get('record_count', 0) for item in response['Items'])
-            
-            # Get unique data sources
-            data_sources = set(item['data_source'] for item in response['Items'])
+            # Get data from last 24 hours (spans today's and yesterday's
+            # day partitions)
+            items = self._query_recent_items(days=1)
+
+            # Calculate summary statistics in a single pass, unboxing the
+            # DynamoDB Decimals once instead of per-aggregate
+            total_collections = 0
+            successful_collections = 0
+            total_records = 0
+            data_sources = set()
+            for item in items:
+                total_collections += 1
+                if item['success']:
+                    successful_collections += 1
+                total_records += int(item.get('record_count', 0) or 0)
+                data_sources.add(item['data_source'])
             
             # Calculate success rate
             success_rate = (successful_collections / total_collections * 100) if total_collections > 0 else 0
@@ -183,9 +270,9 @@ class APIHandler:
                     'active_data_sources': len(data_sources),
                     'data_sources': list(data_sources)
                 },
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': self.request_time,
                 'period': '24 hours'
-            })
+            }, headers={'Cache-Control': 'max-age=60'})
             
         except Exception as e:
             logger.error(f"Failed to get dashboard summary: {str(e)}")
@@ -206,18 +293,26 @@ class APIHandler:
             
             files = []
             if 'Contents' in response:
-                for obj in response['Contents']:
-                    # Get object metadata
+                # User metadata is not returned by ListObjectsV2, so one HEAD
+                # per key is unavoidable - issue them as a parallel wave
+                # instead of serial round-trips
+                def _head(key: str) -> Dict:
                     try:
                         metadata_response = s3_client.head_object(
                             Bucket=S3_BUCKET,
-                            Key=obj['Key']
+                            Key=key
                         )
-                        metadata = metadata_response.get('Metadata', {})
+                        return metadata_response.get('Metadata', {})
                     except Exception as e:
-                        logger.warning(f"Failed to get metadata for {obj['Key']}: {str(e)}")
-                        metadata = {}
-                    
+                        logger.warning(f"Failed to get metadata for {key}: {str(e)}")
+                        return {}
+
+                objects = response['Contents']
+                metadatas = list(self._s3_meta_pool.map(
+                    _head, [obj['Key'] for obj in objects]
+                ))
+
+                for obj, metadata in zip(objects, metadatas):
                     files.append({
                         'key': obj['Key'],
                         'size': obj['Size'],
@@ -232,7 +327,7 @@ class APIHandler:
                 'count': len(files),
                 'bucket': S3_BUCKET,
                 'prefix': prefix,
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': self.request_time
             })
             
         except Exception as e:
@@ -267,7 +362,7 @@ class APIHandler:
                     'dynamodb': 'healthy' if dynamodb_healthy else 'unhealthy',
                     's3': 'healthy' if s3_healthy else 'unhealthy'
                 },
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': self.request_time,
                 'environment': ENVIRONMENT,
                 'version': '1.0.0'
             })
@@ -277,27 +372,41 @@ class APIHandler:
             return self.create_response(500, {
                 'status': 'unhealthy',
                 'error': str(e),
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': self.request_time
             })
 
+# Constructed once per container so warm invocations reuse the handler,
+# its thread pool and the clients' pooled connections
+HANDLER = APIHandler()
+
 def lambda_handler(event, context):
     """
     Main Lambda handler function
-    
+
     Args:
         event: AWS Lambda event object from API Gateway
         context: AWS Lambda context object
-    
+
     Returns:
         dict: API Gateway response
     """
-    
-    logger.info(f"Received event: {json.dumps(event)}")
-    
+
+    logger.info(f"Received event: {orjson.dumps(event, default=_json_default).decode()}")
+
     try:
-        # Initialize API handler
-        handler = APIHandler()
-        
+        handler = HANDLER
+        handler.request_time = datetime.utcnow().isoformat()
+
+        # Honour the client's Accept-Encoding for response compression
+        request_headers = event.get('headers') or {}
+        accept_encoding = next(
+            (value for name, value in request_headers.items()
+             if name.lower() == 'accept-encoding'),
+            ''
+        )
+        handler.accepts_gzip = 'gzip' in accept_encoding.lower()
+        encoding_key = 'gz' if handler.accepts_gzip else 'id'
+
         # Get HTTP method and path
         http_method = event.get('httpMethod', 'GET')
         path = event.get('path', '/')
@@ -313,10 +422,12 @@ def lambda_handler(event, context):
             return handler.get_health_check()
         
         elif path == '/api/data-sources':
-            return handler.get_data_sources_status()
-        
+            return _cached(f'data_sources:{encoding_key}', 30,
+                           handler.get_data_sources_status)
+
         elif path == '/api/dashboard/summary':
-            return handler.get_dashboard_summary()
+            return _cached(f'dashboard_summary:{encoding_key}', 60,
+                           handler.get_dashboard_summary)
         
         elif path.startswith('/api/data-sources/') and path.endswith('/recent'):
             # Extract data source from path
@@ -346,13 +457,12 @@ def lambda_handler(event, context):
         
     except Exception as e:
         logger.error(f"Lambda execution failed: {str(e)}")
-        
+
         # Create error response
-        handler = APIHandler()
-        return handler.create_response(500, {
+        return HANDLER.create_response(500, {
             'error': 'Internal server error',
             'message': str(e),
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': HANDLER.request_time
         })
 
 # For local testing
@@ -3,27 +3,69 @@ NEXUS_ENA Data Collector Lambda Function
 Collects energy market data from external APIs and stores in S3/DynamoDB
 """
 
+import asyncio
+import hashlib
 import json
+import orjson
 import boto3
+from botocore.config import Config
 import logging
 import os
-import pandas as pd
+import threading
+import time
 import requests
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-import pyarrow.parquet as pq
 import pyarrow as pa
-from io import StringIO, BytesIO
-import hashlib
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-# AWS clients
-s3_client = boto3.client('s3')
-dynamodb = boto3.resource('dynamodb')
-ssm_client = boto3.client('ssm')
+# AWS clients - keep-alive and a sized pool so warm invocations reuse the
+# HTTPS connections instead of re-handshaking
+_BOTO_CFG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=32,
+    retries={'mode': 'adaptive', 'total_max_attempts': 4},
+    connect_timeout=2,
+    read_timeout=8
+)
+dynamodb = boto3.resource('dynamodb', config=_BOTO_CFG)
+ssm_client = boto3.client('ssm', config=_BOTO_CFG)
+
+# Arrow filesystem for streaming Parquet writes - multipart upload runs
+# while the table is still being compressed. Built lazily so cold start
+# defers the pyarrow.fs import and the S3 client spin-up until the first
+# save. When the bucket has Transfer Acceleration enabled
+# (S3_TRANSFER_ACCELERATION=true), uploads enter AWS's edge network instead
+# of crossing the public internet to the bucket region.
+_S3_ACCELERATE = os.environ.get('S3_TRANSFER_ACCELERATION', 'false').lower() == 'true'
+_S3FS = None
+
+def _s3_filesystem():
+    global _S3FS
+    if _S3FS is None:
+        import pyarrow.fs as pafs
+        kwargs = {}
+        if _S3_ACCELERATE:
+            # The accelerate endpoint only accepts virtual-hosted-style
+            # requests; an endpoint override alone would flip Arrow's client
+            # to path-style and fail every upload (hence the pyarrow>=16
+            # floor, where force_virtual_addressing first appears)
+            kwargs = {
+                'endpoint_override': 'https://s3-accelerate.amazonaws.com',
+                'force_virtual_addressing': True
+            }
+        _S3FS = pafs.S3FileSystem(
+            region=os.environ.get('AWS_REGION', 'us-east-1'),
+            **kwargs
+        )
+    return _S3FS
+
+# API keys survive here between invocations of a warm container, so SSM is
+# only hit on cold starts
+_API_KEYS_CACHE: Dict[str, str] = {}
 
 # Environment variables
 S3_BUCKET = os.environ['S3_BUCKET']
@@ -52,60 +94,159 @@ DATA_SOURCES = {
     }
 }
 
+# Key regions for energy market impact, with a fixed per-region seed for the
+# mock readings. hash() is salted per process, so deriving the seed once at
+# import keeps the mock values stable and drops the repeated hash calls.
+_WEATHER_REGIONS = ['New York', 'California', 'Texas', 'Pennsylvania']
+_REGION_SEED = {region: sum(region.encode()) for region in _WEATHER_REGIONS}
+
+# Storage types for known columns. Low-cardinality strings become dictionary
+# columns (integer indices + RLE in Parquet) and the numeric columns use the
+# narrowest type that holds their range; unknown columns keep their inferred
+# type.
+_COLUMN_TYPES = {
+    'region': pa.dictionary(pa.int8(), pa.string()),
+    'data_type': pa.dictionary(pa.int8(), pa.string()),
+    'source': pa.dictionary(pa.int8(), pa.string()),
+    'indicator': pa.dictionary(pa.int8(), pa.string()),
+    'unit': pa.dictionary(pa.int8(), pa.string()),
+    'price': pa.float32(),
+    'value': pa.float32(),
+    'demand': pa.int32(),
+    'supply': pa.int32(),
+    'capacity': pa.int32(),
+    'generation': pa.int32(),
+    'temperature': pa.float32(),
+    'humidity': pa.float32(),
+    'wind_speed': pa.float32(),
+    'cloud_cover': pa.float32()
+}
+
+# Fixed schema per source, built once at import. Passing these to the table
+# constructors skips per-invocation type inference and pins every partition
+# to the same schema, which keeps downstream Athena/Glue readers happy.
+_LSEG_SCHEMA = pa.schema([
+    ('region', _COLUMN_TYPES['region']),
+    ('price', _COLUMN_TYPES['price']),
+    ('demand', _COLUMN_TYPES['demand']),
+    ('supply', _COLUMN_TYPES['supply']),
+    ('source', _COLUMN_TYPES['source']),
+    ('capacity', _COLUMN_TYPES['capacity']),
+    ('generation', _COLUMN_TYPES['generation']),
+    ('data_type', _COLUMN_TYPES['data_type']),
+    ('timestamp', pa.string())
+])
+_WEATHER_SCHEMA = pa.schema([
+    ('region', _COLUMN_TYPES['region']),
+    ('temperature', _COLUMN_TYPES['temperature']),
+    ('humidity', _COLUMN_TYPES['humidity']),
+    ('wind_speed', _COLUMN_TYPES['wind_speed']),
+    ('cloud_cover', _COLUMN_TYPES['cloud_cover']),
+    ('timestamp', pa.string())
+])
+_ECONOMIC_SCHEMA = pa.schema([
+    ('indicator', _COLUMN_TYPES['indicator']),
+    ('value', _COLUMN_TYPES['value']),
+    ('unit', _COLUMN_TYPES['unit']),
+    ('timestamp', pa.string())
+])
+
 class DataCollectionError(Exception):
     """Custom exception for data collection errors"""
     pass
 
+# Collected tables cached per source with stale-while-revalidate semantics.
+# Weather and economic indicators move on minute-to-hour scales, so warm
+# invocations inside the TTL reuse the last table instead of re-hitting the
+# upstream API.
+_TABLE_CACHE: Dict[str, tuple] = {}
+_REFRESHING = set()
+
+def _fetch_with_swr(key: str, ttl: float, stale: float, fn) -> Optional[pa.Table]:
+    """Fetch through a TTL cache, serving stale entries while revalidating
+
+    Fresh hit: return the cached table. Stale hit (older than ttl but
+    younger than stale): return the cached table and refresh in a background
+    thread - if the container freezes first, the refresh resumes on the next
+    invocation. Miss or expired: fetch synchronously.
+    """
+    now = time.monotonic()
+    entry = _TABLE_CACHE.get(key)
+    if entry:
+        age = now - entry[0]
+        if age < ttl:
+            return entry[1]
+        if age < stale:
+            if key not in _REFRESHING:
+                _REFRESHING.add(key)
+
+                def _refresh():
+                    try:
+                        result = fn()
+                        if result is not None:
+                            _TABLE_CACHE[key] = (time.monotonic(), result)
+                    finally:
+                        _REFRESHING.discard(key)
+
+                threading.Thread(target=_refresh, daemon=True).start()
+            return entry[1]
+
+    result = fn()
+    if result is not None:
+        _TABLE_CACHE[key] = (time.monotonic(), result)
+    return result
+
 class DataCollector:
     """Main data collection class"""
     
     def __init__(self):
         self.table = dynamodb.Table(DYNAMODB_TABLE)
         self.api_keys = {}
+        # Per-source metadata queued here and flushed in one batched write
+        # at the end of the invocation (list.append is thread-safe, so the
+        # concurrent source workers can share it)
+        self._pending_metadata = []
         self.load_api_keys()
     
     def load_api_keys(self):
-        """Load API keys from Systems Manager Parameter Store"""
+        """Load API keys from Systems Manager Parameter Store (cached)"""
+        if _API_KEYS_CACHE:
+            self.api_keys = _API_KEYS_CACHE
+            return
         try:
-            # Get Claude API key
-            response = ssm_client.get_parameter(
-                Name=f'/nexus-ena/claude-api-key',
-                WithDecryption=True
-            )
-            self.api_keys['claude'] = response['Parameter']['Value']
-            
-            # Get LSEG API key
-            response = ssm_client.get_parameter(
-                Name=f'/nexus-ena/lseg-api-key',
+            # One GetParameters round-trip for all four keys instead of four
+            # sequential get_parameter calls
+            parameter_names = {
+                '/nexus-ena/claude-api-key': 'claude',
+                '/nexus-ena/lseg-api-key': 'lseg',
+                '/nexus-ena/weather-api-key': 'weather',
+                '/nexus-ena/economic-api-key': 'economic'
+            }
+            response = ssm_client.get_parameters(
+                Names=list(parameter_names),
                 WithDecryption=True
             )
-            self.api_keys['lseg'] = response['Parameter']['Value']
-            
-            # Get Weather API key (optional)
-            try:
-                response = ssm_client.get_parameter(
-                    Name=f'/nexus-ena/weather-api-key',
-                    WithDecryption=True
-                )
-                self.api_keys['weather'] = response['Parameter']['Value']
-            except ssm_client.exceptions.ParameterNotFound:
-                logger.warning("Weather API key not found, skipping weather data collection")
-            
-            # Get Economic API key (optional)
-            try:
-                response = ssm_client.get_parameter(
-                    Name=f'/nexus-ena/economic-api-key',
-                    WithDecryption=True
-                )
-                self.api_keys['economic'] = response['Parameter']['Value']
-            except ssm_client.exceptions.ParameterNotFound:
-                logger.warning("Economic API key not found, skipping economic data collection")
-                
+
+            for parameter in response['Parameters']:
+                self.api_keys[parameter_names[parameter['Name']]] = parameter['Value']
+
+            # Weather/economic keys are optional; anything else missing is fatal
+            for name in response.get('InvalidParameters', []):
+                source = parameter_names[name]
+                if source in ('claude', 'lseg'):
+                    raise DataCollectionError(f"Required API key not found: {name}")
+                logger.info(f"{source.capitalize()} API key not found, "
+                            f"skipping {source} data collection")
+
+            _API_KEYS_CACHE.update(self.api_keys)
+
+        except DataCollectionError:
+            raise
         except Exception as e:
             logger.error(f"Failed to load API keys: {str(e)}")
             raise DataCollectionError(f"API key loading failed: {str(e)}")
     
-    def collect_lseg_data(self) -> Optional[pd.DataFrame]:
+    def collect_lseg_data(self, collected_at: Optional[str] = None) -> Optional[pa.Table]:
         """Collect power market data from LSEG API"""
         if 'lseg' not in self.api_keys:
             logger.warning("LSEG API key not available")
@@ -121,7 +262,7 @@ class DataCollector:
             # Example power market data structure
             # In production, replace with actual LSEG API endpoints
             mock_data = {
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': collected_at or datetime.utcnow().isoformat(),
                 'power_prices': [
                     {'region': 'PJM', 'price': 45.50, 'demand': 85000, 'supply': 90000},
                     {'region': 'CAISO', 'price': 52.30, 'demand': 42000, 'supply': 45000},
@@ -135,28 +276,35 @@ class DataCollector:
                 ]
             }
             
-            # Convert to DataFrame
-            power_df = pd.DataFrame(mock_data['power_prices'])
-            renewable_df = pd.DataFrame(mock_data['renewable_generation'])
-            
-            # Add timestamp to all records
-            power_df['timestamp'] = mock_data['timestamp']
-            renewable_df['timestamp'] = mock_data['timestamp']
-            
-            # Combine datasets
-            combined_df = pd.concat([
-                power_df.assign(data_type='power_prices'),
-                renewable_df.assign(data_type='renewable_generation')
-            ], ignore_index=True)
-            
-            logger.info(f"Collected {len(combined_df)} LSEG data points")
-            return combined_df
+            # Build the columns directly in schema order - fields that only
+            # apply to one data_type are null for the other, with no
+            # intermediate row dicts or per-row copies
+            timestamp = mock_data['timestamp']
+            power = mock_data['power_prices']
+            renewables = mock_data['renewable_generation']
+            n_power = len(power)
+            n_renew = len(renewables)
+
+            combined = pa.table({
+                'region': [r['region'] for r in power] + [None] * n_renew,
+                'price': [r['price'] for r in power] + [None] * n_renew,
+                'demand': [r['demand'] for r in power] + [None] * n_renew,
+                'supply': [r['supply'] for r in power] + [None] * n_renew,
+                'source': [None] * n_power + [r['source'] for r in renewables],
+                'capacity': [None] * n_power + [r['capacity'] for r in renewables],
+                'generation': [None] * n_power + [r['generation'] for r in renewables],
+                'data_type': ['power_prices'] * n_power + ['renewable_generation'] * n_renew,
+                'timestamp': [timestamp] * (n_power + n_renew)
+            }, schema=_LSEG_SCHEMA)
+
+            logger.info(f"Collected {combined.num_rows} LSEG data points")
+            return combined
             
         except Exception as e:
             logger.error(f"LSEG data collection failed: {str(e)}")
             return None
     
-    def collect_weather_data(self) -> Optional[pd.DataFrame]:
+    def collect_weather_data(self, collected_at: Optional[str] = None) -> Optional[pa.Table]:
         """Collect weather data affecting energy markets"""
         if 'weather' not in self.api_keys:
             logger.warning("Weather API key not available")
@@ -164,31 +312,26 @@ class DataCollector:
             
         try:
             # Mock weather API call - replace with actual API (OpenWeatherMap, etc.)
-            # Key regions for energy market impact
-            regions = ['New York', 'California', 'Texas', 'Pennsylvania']
-            weather_data = []
-            
-            for region in regions:
-                # Mock weather data - replace with actual API calls
-                weather_point = {
-                    'region': region,
-                    'temperature': 72.5 + (hash(region) % 20) - 10,  # Mock temp
-                    'humidity': 65 + (hash(region) % 30),
-                    'wind_speed': 8.5 + (hash(region) % 15),
-                    'cloud_cover': 40 + (hash(region) % 60),
-                    'timestamp': datetime.utcnow().isoformat()
-                }
-                weather_data.append(weather_point)
-            
-            weather_df = pd.DataFrame(weather_data)
-            logger.info(f"Collected {len(weather_df)} weather data points")
-            return weather_df
+            collected_at = collected_at or datetime.utcnow().isoformat()
+            seeds = [_REGION_SEED[region] for region in _WEATHER_REGIONS]
+
+            # Build the table column-wise in one shot
+            weather_table = pa.table({
+                'region': _WEATHER_REGIONS,
+                'temperature': [72.5 + (seed % 20) - 10 for seed in seeds],
+                'humidity': [65 + (seed % 30) for seed in seeds],
+                'wind_speed': [8.5 + (seed % 15) for seed in seeds],
+                'cloud_cover': [40 + (seed % 60) for seed in seeds],
+                'timestamp': [collected_at] * len(_WEATHER_REGIONS)
+            }, schema=_WEATHER_SCHEMA)
+            logger.info(f"Collected {weather_table.num_rows} weather data points")
+            return weather_table
             
         except Exception as e:
             logger.error(f"Weather data collection failed: {str(e)}")
             return None
     
-    def collect_economic_data(self) -> Optional[pd.DataFrame]:
+    def collect_economic_data(self, collected_at: Optional[str] = None) -> Optional[pa.Table]:
         """Collect economic indicators affecting energy markets"""
         if 'economic' not in self.api_keys:
             logger.warning("Economic API key not available")
@@ -197,7 +340,7 @@ class DataCollector:
         try:
             # Mock economic indicators - replace with actual API (FRED, Alpha Vantage)
             economic_data = {
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': collected_at or datetime.utcnow().isoformat(),
                 'indicators': [
                     {'indicator': 'crude_oil_wti', 'value': 82.45, 'unit': 'USD/barrel'},
                     {'indicator': 'natural_gas_henry_hub', 'value': 3.85, 'unit': 'USD/MMBtu'},
@@ -208,87 +351,133 @@ class DataCollector:
                 ]
             }
             
-            econ_df = pd.DataFrame(economic_data['indicators'])
-            econ_df['timestamp'] = economic_data['timestamp']
-            
-            logger.info(f"Collected {len(econ_df)} economic indicators")
-            return econ_df
+            econ_table = pa.Table.from_pylist(
+                [dict(record, timestamp=economic_data['timestamp'])
+                 for record in economic_data['indicators']],
+                schema=_ECONOMIC_SCHEMA
+            )
+
+            logger.info(f"Collected {econ_table.num_rows} economic indicators")
+            return econ_table
             
         except Exception as e:
             logger.error(f"Economic data collection failed: {str(e)}")
             return None
     
-    def save_to_s3(self, df: pd.DataFrame, data_source: str) -> str:
-        """Save DataFrame to S3 in Parquet format"""
+    def _align_to_schema(self, table: pa.Table, schema: pa.Schema) -> pa.Table:
+        """Project a table onto the unified schema, null-filling absent columns"""
+        arrays = []
+        for field in schema:
+            if field.name in table.column_names:
+                arrays.append(table.column(field.name).cast(field.type))
+            else:
+                arrays.append(pa.nulls(table.num_rows, field.type))
+        return pa.table(arrays, schema=schema)
+
+    def save_to_s3(self, tables: Dict[str, pa.Table],
+                   now: Optional[datetime] = None) -> Dict[str, str]:
+        """Write every source's table as one partitioned dataset
+
+        The tables are aligned onto their unified schema (absent columns
+        become nulls), stacked, and written in a single write_to_dataset
+        call partitioned by data_source under the day's prefix. One write
+        per invocation instead of one per source, with the same
+        one-file-per-source layout on S3; returns the partition prefix per
+        source.
+        """
+        # Deferred so cold starts that never reach a save skip the import;
+        # Python caches it after the first call
+        import pyarrow.parquet as pq
+
         try:
-            # Generate file path with partitioning
-            now = datetime.utcnow()
-            year = now.strftime('%Y')
-            month = now.strftime('%m')
-            day = now.strftime('%d')
-            hour = now.strftime('%H')
-            
-            # Create file path
-            file_key = f"raw-data/year={year}/month={month}/day={day}/{data_source}_{now.strftime('%Y%m%d_%H%M%S')}.parquet"
-            
-            # Convert DataFrame to Parquet bytes
-            table = pa.Table.from_pandas(df)
-            parquet_buffer = BytesIO()
-            pq.write_table(table, parquet_buffer)
-            parquet_bytes = parquet_buffer.getvalue()
-            
-            # Upload to S3
-            s3_client.put_object(
-                Bucket=S3_BUCKET,
-                Key=file_key,
-                Body=parquet_bytes,
-                ContentType='application/octet-stream',
-                ServerSideEncryption='AES256',
-                Metadata={
-                    'data_source': data_source,
-                    'record_count': str(len(df)),
-                    'collection_time': now.isoformat(),
-                    'environment': ENVIRONMENT
-                }
+            now = now or datetime.utcnow()
+            date_prefix = (
+                f"raw-data/year={now.strftime('%Y')}"
+                f"/month={now.strftime('%m')}/day={now.strftime('%d')}"
             )
-            
-            logger.info(f"Saved {len(df)} records to s3://{S3_BUCKET}/{file_key}")
-            return file_key
-            
+
+            # The collectors build on the static schemas, so unification is
+            # cheap and deterministic
+            unified = pa.unify_schemas([t.schema for t in tables.values()])
+            aligned = [
+                self._align_to_schema(table, unified).append_column(
+                    'data_source',
+                    pa.array([source_name] * table.num_rows, type=pa.string())
+                )
+                for source_name, table in tables.items()
+            ]
+            combined = pa.concat_tables(aligned)
+
+            pq.write_to_dataset(
+                combined,
+                root_path=f"{S3_BUCKET}/{date_prefix}",
+                partition_cols=['data_source'],
+                filesystem=_s3_filesystem(),
+                basename_template=f"{now.strftime('%Y%m%d_%H%M%S')}-{{i}}.parquet",
+                existing_data_behavior='overwrite_or_ignore',
+                compression='zstd', compression_level=3,
+                use_dictionary=True, data_page_size=64 * 1024
+            )
+
+            logger.info(
+                f"Saved {combined.num_rows} records from {len(tables)} sources "
+                f"to s3://{S3_BUCKET}/{date_prefix}/"
+            )
+            return {
+                source_name: f"{date_prefix}/data_source={source_name}/"
+                for source_name in tables
+            }
+
         except Exception as e:
-            logger.error(f"S3 save failed for {data_source}: {str(e)}")
+            logger.error(f"S3 save failed: {str(e)}")
             raise DataCollectionError(f"S3 save failed: {str(e)}")
     
-    def update_metadata(self, data_source: str, file_key: str, record_count: int, success: bool):
-        """Update metadata in DynamoDB"""
+    def update_metadata(self, data_source: str, file_key: str, record_count: int,
+                        success: bool, timestamp: Optional[str] = None):
+        """Queue metadata for a batched DynamoDB write"""
+        timestamp = timestamp or datetime.utcnow().isoformat()
+
+        item = {
+            'data_source': data_source,
+            'timestamp': timestamp,
+            'day': timestamp[:10],  # partition key of the by-day-ts GSI
+            'file_key': file_key,
+            'record_count': record_count,
+            'success': success,
+            'environment': ENVIRONMENT,
+            'ttl': int((datetime.utcnow() + timedelta(days=90)).timestamp())  # Auto-cleanup
+        }
+
+        if not success:
+            item['error_message'] = f"Collection failed for {data_source}"
+
+        self._pending_metadata.append(item)
+
+    def flush_metadata(self):
+        """Write all queued metadata in one BatchWriteItem pass"""
+        if not self._pending_metadata:
+            return
+
         try:
-            timestamp = datetime.utcnow().isoformat()
-            
-            # Calculate data hash for integrity check
-            data_hash = hashlib.md5(f"{data_source}_{timestamp}_{record_count}".encode()).hexdigest()
-            
-            item = {
-                'data_source': data_source,
-                'timestamp': timestamp,
-                'file_key': file_key,
-                'record_count': record_count,
-                'success': success,
-                'environment': ENVIRONMENT,
-                'data_hash': data_hash,
-                'ttl': int((datetime.utcnow() + timedelta(days=90)).timestamp())  # Auto-cleanup
-            }
-            
-            if not success:
-                item['error_message'] = f"Collection failed for {data_source}"
-            
-            self.table.put_item(Item=item)
-            logger.info(f"Updated metadata for {data_source}: {record_count} records")
-            
+            with self.table.batch_writer() as batch:
+                for item in self._pending_metadata:
+                    batch.put_item(Item=item)
+
+            logger.info(f"Updated metadata for {len(self._pending_metadata)} sources")
+            self._pending_metadata = []
+
         except Exception as e:
-            logger.error(f"Metadata update failed for {data_source}: {str(e)}")
+            logger.error(f"Metadata update failed: {str(e)}")
     
-    def process_data_source(self, source_name: str) -> Dict[str, Any]:
-        """Process a single data source"""
+    def process_data_source(self, source_name: str, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Process a single data source
+
+        `now` is the invocation timestamp; every record, partition path and
+        metadata row produced for this source carries the same instant, so
+        concurrent sources land in the same partition.
+        """
+        now = now or datetime.utcnow()
+        collected_at = now.isoformat()
         result = {
             'source': source_name,
             'success': False,
@@ -304,31 +493,33 @@ class DataCollector:
                 return result
             
             # Collect data based on source
-            df = None
+            table = None
             if source_name == 'lseg':
-                df = self.collect_lseg_data()
+                table = self.collect_lseg_data(collected_at)
             elif source_name == 'weather':
-                df = self.collect_weather_data()
+                table = _fetch_with_swr(
+                    'weather', ttl=300, stale=900,
+                    fn=lambda: self.collect_weather_data(collected_at)
+                )
             elif source_name == 'economic':
-                df = self.collect_economic_data()
+                table = _fetch_with_swr(
+                    'economic', ttl=900, stale=2700,
+                    fn=lambda: self.collect_economic_data(collected_at)
+                )
             else:
                 result['error'] = f"Unknown data source: {source_name}"
                 return result
             
-            if df is None or len(df) == 0:
+            if table is None or table.num_rows == 0:
                 result['error'] = f"No data collected from {source_name}"
                 return result
-            
-            # Save to S3
-            file_key = self.save_to_s3(df, source_name)
-            
-            # Update metadata
-            self.update_metadata(source_name, file_key, len(df), True)
-            
+
+            # The S3 write and success metadata happen once for all sources
+            # after the gather - hand the table back to the handler
             result.update({
                 'success': True,
-                'record_count': len(df),
-                'file_key': file_key
+                'record_count': table.num_rows,
+                'table': table
             })
             
         except Exception as e:
@@ -337,10 +528,51 @@ class DataCollector:
             logger.error(f"Failed to process {source_name}: {error_msg}")
             
             # Update metadata with failure
-            self.update_metadata(source_name, None, 0, False)
+            self.update_metadata(source_name, None, 0, False, collected_at)
         
         return result
 
+# What each source last wrote: day -> content digest -> partition key.
+# Scheduled re-runs inside a warm container skip the S3 write and metadata
+# row for a source whose data has not actually changed.
+_LAST_WRITE: Dict[str, tuple] = {}
+
+def _table_digest(table: pa.Table) -> str:
+    """Content hash of a table, ignoring the per-invocation timestamp"""
+    rows = table.drop(['timestamp']).to_pylist()
+    return hashlib.blake2b(orjson.dumps(rows), digest_size=16).hexdigest()
+
+# Built lazily on first invocation and reused while the container is warm,
+# so construction (table lookup, key loading) is paid once. Lambda runs one
+# event at a time per container, so sharing it is safe.
+_COLLECTOR: Optional[DataCollector] = None
+
+async def _collect_all_sources(collector: DataCollector, sources: List[str],
+                               now: datetime) -> List[Dict[str, Any]]:
+    """Run every enabled source's collection concurrently
+
+    Each source blocks on its upstream API call, so running them in worker
+    threads overlaps the I/O and the invocation takes ~max(source latency)
+    instead of the sum. The S3 write happens afterwards, fused across
+    sources.
+
+    Results are logged the moment each source finishes rather than when the
+    slowest one does, so CloudWatch shows per-source progress during the
+    invocation instead of a single blob at the end.
+    """
+    loop = asyncio.get_running_loop()
+    tasks = [
+        loop.run_in_executor(None, collector.process_data_source, source_name, now)
+        for source_name in sources
+    ]
+    results = []
+    for task in asyncio.as_completed(tasks):
+        result = await task
+        summary = {k: v for k, v in result.items() if k != 'table'}
+        logger.info(f"Source completed: {orjson.dumps(summary).decode()}")
+        results.append(result)
+    return results
+
 def lambda_handler(event, context):
     """
     Main Lambda handler function
@@ -357,25 +589,79 @@ def lambda_handler(event, context):
     logger.info(f"Starting data collection at {start_time.isoformat()}")
     
     try:
-        # Initialize data collector
-        collector = DataCollector()
+        # Initialize data collector once per container
+        global _COLLECTOR
+        if _COLLECTOR is None:
+            _COLLECTOR = DataCollector()
+        collector = _COLLECTOR
         
-        # Process each enabled data source
-        results = []
+        # Process every enabled data source concurrently
+        enabled_sources = [
+            source_name for source_name, config in DATA_SOURCES.items()
+            if config.get('enabled', False)
+        ]
+        logger.info(f"Processing data sources: {', '.join(enabled_sources)}")
+        results = asyncio.run(_collect_all_sources(collector, enabled_sources, start_time))
+
+        # One partitioned dataset write covers everything collected this
+        # invocation; per-source metadata is queued once the keys are known
+        tables = {}
+        for result in results:
+            table = result.pop('table', None)
+            if table is not None:
+                tables[result['source']] = table
+
+        collected_at = start_time.isoformat()
+        day = collected_at[:10]
+
+        # Skip sources whose content is identical to what this container
+        # already wrote today - no S3 write, no metadata row, no WCUs
+        digests = {}
+        for source_name in list(tables):
+            digests[source_name] = _table_digest(tables[source_name])
+            cached = _LAST_WRITE.get(source_name)
+            if cached and cached[0] == day and cached[1] == digests[source_name]:
+                logger.info(f"{source_name} data unchanged since last write, skipping")
+                for result in results:
+                    if result['source'] == source_name:
+                        result['file_key'] = cached[2]
+                        result['skipped_unchanged'] = True
+                del tables[source_name]
+
+        if tables:
+            try:
+                file_keys = collector.save_to_s3(tables, start_time)
+                for result in results:
+                    file_key = file_keys.get(result['source'])
+                    if file_key:
+                        result['file_key'] = file_key
+                        # Only remember writes that actually landed
+                        _LAST_WRITE[result['source']] = (
+                            day, digests[result['source']], file_key
+                        )
+                        collector.update_metadata(
+                            result['source'], file_key,
+                            result['record_count'], True, collected_at
+                        )
+            except DataCollectionError as e:
+                for result in results:
+                    if result['source'] in tables:
+                        result.update({'success': False, 'error': str(e)})
+                        collector.update_metadata(
+                            result['source'], None, 0, False, collected_at
+                        )
+
+        # Flush the queued per-source metadata in one batched write
+        collector.flush_metadata()
+
         total_records = 0
         successful_sources = 0
-        
-        for source_name in DATA_SOURCES.keys():
-            if DATA_SOURCES[source_name].get('enabled', False):
-                logger.info(f"Processing data source: {source_name}")
-                result = collector.process_data_source(source_name)
-                results.append(result)
-                
-                if result['success']:
-                    successful_sources += 1
-                    total_records += result['record_count']
-                else:
-                    logger.error(f"Failed to process {source_name}: {result['error']}")
+        for result in results:
+            if result['success']:
+                successful_sources += 1
+                total_records += result['record_count']
+            else:
+                logger.error(f"Failed to process {result['source']}: {result['error']}")
         
         # Calculate execution time
         end_time = datetime.utcnow()
@@ -384,7 +670,7 @@ def lambda_handler(event, context):
         # Prepare response
         response = {
             'statusCode': 200 if successful_sources > 0 else 500,
-            'body': json.dumps({
+            'body': orjson.dumps({
                 'message': 'Data collection completed',
                 'timestamp': end_time.isoformat(),
                 'execution_time_seconds': execution_time,
@@ -394,7 +680,7 @@ def lambda_handler(event, context):
                 'results': results,
                 's3_bucket': S3_BUCKET,
                 'environment': ENVIRONMENT
-            }, default=str)
+            }).decode()
         }
         
         logger.info(f"Collection completed: {successful_sources} sources, {total_records} records, {execution_time:.2f}s")
@@ -406,11 +692,11 @@ def lambda_handler(event, context):
         
         return {
             'statusCode': 500,
-            'body': json.dumps({
+            'body': orjson.dumps({
                 'error': error_msg,
                 'timestamp': datetime.utcnow().isoformat(),
                 'environment': ENVIRONMENT
-            })
+            }).decode()
         }
 
 # For local testing
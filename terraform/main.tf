@@ -48,6 +48,11 @@ resource "aws_s3_bucket_versioning" "data_lake" {
   }
 }
 
+resource "aws_s3_bucket_accelerate_configuration" "data_lake" {
+  bucket = aws_s3_bucket.data_lake.id
+  status = var.s3_transfer_acceleration ? "Enabled" : "Suspended"
+}
+
 resource "aws_s3_bucket_server_side_encryption_configuration" "data_lake" {
   bucket = aws_s3_bucket.data_lake.id
   rule {
@@ -119,7 +124,36 @@ resource "aws_dynamodb_table" "metadata" {
     name = "timestamp"
     type = "S"
   }
-  
+
+  attribute {
+    name = "day"
+    type = "S"
+  }
+
+  attribute {
+    name = "file_id"
+    type = "S"
+  }
+
+  # Time-bucketed index so the API can query a day partition instead of
+  # scanning the whole table
+  global_secondary_index {
+    name            = "by-day-ts"
+    hash_key        = "day"
+    range_key       = "timestamp"
+    projection_type = "ALL"
+  }
+
+  # Per-file index for the SFTP collector's unchanged-file check - its
+  # items share the lseg_sftp partition, so looking up one file's latest
+  # etag needs a file-keyed index
+  global_secondary_index {
+    name            = "by-file-ts"
+    hash_key        = "file_id"
+    range_key       = "timestamp"
+    projection_type = "ALL"
+  }
+
   point_in_time_recovery {
     enabled = true
   }
@@ -212,9 +246,10 @@ resource "aws_lambda_function" "data_collector" {
       ENVIRONMENT = var.environment
       S3_BUCKET   = aws_s3_bucket.data_lake.bucket
       DYNAMODB_TABLE = aws_dynamodb_table.metadata.name
+      S3_TRANSFER_ACCELERATION = var.s3_transfer_acceleration ? "true" : "false"
     }
   }
-  
+
   depends_on = [aws_iam_role_policy.lambda_policy]
   tags       = local.common_tags
 }
@@ -608,11 +643,16 @@ resource "aws_cognito_user_pool_client" "web_client" {
 resource "aws_api_gateway_rest_api" "api" {
   name        = "${local.app_name}-api-${var.environment}"
   description = "NEXUS ENA API Gateway"
-  
+
+  # The API handler gzips responses and returns them base64-encoded;
+  # without a binary media type match API Gateway would pass the base64
+  # text through as the body instead of decoding it
+  binary_media_types = ["*/*"]
+
   endpoint_configuration {
     types = ["REGIONAL"]
   }
-  
+
   tags = local.common_tags
 }
 
@@ -63,6 +63,12 @@ variable "economic_api_key" {
   default     = ""
 }
 
+variable "s3_transfer_acceleration" {
+  description = "Enable S3 Transfer Acceleration on the data lake bucket (extra per-GB cost, mainly helps cross-region uploads)"
+  type        = bool
+  default     = false
+}
+
 variable "cost_threshold" {
   description = "Monthly cost threshold in USD for alerts"
   type        = number